@@ -7,18 +7,13 @@ from marshmallow import ValidationError
 from flask_jwt_extended import JWTManager
 from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import scoped_session, sessionmaker
-from api.routes.applicants import applicants_bp
-from api.routes.schemes import schemes_bp
-from api.routes.applications import applications_bp
-from api.routes.auth import auth_bp  
+from sqlalchemy.orm import sessionmaker
 from config import Config
 from dal.database import Base  # Import your Base model
 
 import logging
 
-# Import the Swagger setup function
-from api.swagger_setup import init_swagger_ui
+logger = logging.getLogger(__name__)
 
 # Initialize extensions
 ma = Marshmallow()
@@ -30,8 +25,13 @@ from environs import Env
 
 # Load environment variables
 DATABASE_URL = Env().str("DATABASE_URL", "DATABASE_URL is not set.") 
-api_engine = create_engine(DATABASE_URL)
-api_SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=api_engine))
+api_engine = create_engine(DATABASE_URL, 
+                           pool_size=Config.DB_POOL_SIZE, 
+                           max_overflow=Config.DB_MAX_OVERFLOW, 
+                           pool_pre_ping=Config.DB_POOL_PRE_PING, 
+                           pool_recycle=Config.DB_POOL_RECYCLE, 
+                           pool_use_lifo=Config.DB_POOL_USE_LIFO)
+api_SessionFactory = sessionmaker(bind=api_engine, autocommit=False, autoflush=False) # Plain factory: each request owns its session via g, so no thread-local registry is needed
 
 def setup_db_session(app):
     """Setup SQLAlchemy sessions for the app."""
@@ -39,7 +39,7 @@ def setup_db_session(app):
     @app.before_request
     def create_session():
         """Create a new database session for a request."""
-        g.db_session = api_SessionLocal() # Note: This is a normal session, not a scoped_session
+        g.db_session = api_SessionFactory() # Note: This is a normal session, not a scoped_session
 
     @app.teardown_appcontext
     def remove_session(exception=None):
@@ -52,20 +52,32 @@ def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
 
+    # Route jsonify and request JSON parsing through orjson
+    from api.utils.json import OrjsonProvider
+    app.json = OrjsonProvider(app)
+
     # Initialize extensions with app
     ma.init_app(app)
     jwt.init_app(app)
 
-    # Register routes
+    # Register routes. Blueprints are imported here rather than at module level so that importing the api package 
+    # (e.g. for api_engine) does not pull in every route, schema and service module.
+    from api.routes.applicants import applicants_bp
+    from api.routes.schemes import schemes_bp
+    from api.routes.applications import applications_bp
+    from api.routes.auth import auth_bp
+    from api.routes.health import health_bp
     app.register_blueprint(applicants_bp)
     app.register_blueprint(schemes_bp)
     app.register_blueprint(applications_bp)
     app.register_blueprint(auth_bp) 
+    app.register_blueprint(health_bp)
     
     # Initialize SQLAlchemy session handling
     setup_db_session(app)
     
     # Initialize Swagger UI
+    from api.swagger_setup import init_swagger_ui
     init_swagger_ui(app)
 
 
@@ -82,13 +94,13 @@ def create_app(config_class=Config):
         session = g.get('db_session')
         if session is not None:
             session.rollback()  # Properly rollback the session
-        app.logger.error(f"SQLAlchemy Error: {e}")
+        logger.error("SQLAlchemy Error: %s", e)
         return jsonify({"error": "A database error occurred."}), 500
 
     # General error handler
     @app.errorhandler(Exception)
     def handle_generic_error(e):
-        app.logger.error(f"Unhandled Exception: {e}")
+        logger.error("Unhandled Exception: %s", e)
         return jsonify({"error": str(e)}), 500
     
     return app
@@ -98,4 +110,4 @@ def create_app(config_class=Config):
 # Base.metadata.create_all(bind=api_engine) # Ensure our database tables are created based on the definition of our ORM Models (Idempotent operation)
 
 # Setup logging
-logging.basicConfig(level=logging.DEBUG)  # Set to DEBUG to capture more details
\ No newline at end of file
+logging.basicConfig(level=Config.LOG_LEVEL)  # Defaults to INFO; set LOG_LEVEL=DEBUG to capture more details
\ No newline at end of file
@@ -50,42 +50,93 @@ By addressing these points, the codebase demonstrates strong adherence to non-fu
 
 # api/routes/applicants.py
 
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, request, g
+import orjson
+from api.utils.json import json_response
 from bl.services.applicant_service import ApplicantService
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
+from api.utils.identity import current_admin_id
+from api.utils.etag import compute_etag, not_modified_response
+from api.utils.pagination import parse_pagination, total_pages
 from marshmallow import ValidationError
 from dal.crud_operations import CRUDOperations
-from api.schemas.all_schemas import ApplicantSchema
 from exceptions import InvalidPaginationParameterException, InvalidSortingParameterException
-from sqlalchemy.exc import SQLAlchemyError
 from dal.custom_serializer import serialize
+from api.schemas.all_schemas import ApplicantSchema
 
 applicants_bp = Blueprint('applicants', __name__)
 
+_APPLICANT_FILTER_KEYS = ('employment_status', 'sex', 'marital_status') # Query parameters accepted as equality filters
+
+
+# The applicants POST body schema, built once at import rather than per request
+_applicant_schema = ApplicantSchema()
+
+def _dump_household_member(member):
+    """
+    Straight-line serializer for a HouseholdMember row mapping. Emits the same keys as the generic custom serializer.
+    Datetimes are left for orjson to format when the response is encoded.
+    """
+    return {
+        'id': member['id'],
+        'applicant_id': member['applicant_id'],
+        'name': member['name'],
+        'relation': member['relation'],
+        'date_of_birth': member['date_of_birth'],
+        'employment_status': member['employment_status'],
+        'sex': member['sex'],
+        'created_at': member['created_at'],
+        'updated_at': member['updated_at'],
+    }
+
+def _dump_applicant(applicant):
+    """
+    Straight-line serializer for the applicants list endpoint.
+    Reads the columns of an Applicant row mapping directly instead of reflecting over the mapper for every row, 
+    which keeps the serialization cost of large pages low. Emits the same keys as the generic custom serializer.
+    Datetimes are left for orjson to format when the response is encoded.
+    """
+    return {
+        'id': applicant['id'],
+        'name': applicant['name'],
+        'employment_status': applicant['employment_status'],
+        'sex': applicant['sex'],
+        'date_of_birth': applicant['date_of_birth'],
+        'marital_status': applicant['marital_status'],
+        'marriage_date': applicant['marriage_date'],
+        'employment_status_change_date': applicant['employment_status_change_date'],
+        'created_by_admin_id': applicant['created_by_admin_id'],
+        'created_at': applicant['created_at'],
+        'updated_at': applicant['updated_at'],
+        'household_members': [_dump_household_member(member) for member in applicant['household_members']],
+    }
+
 @applicants_bp.route('/api/applicants', methods=['GET'])
 @jwt_required()
 def get_applicants():
     session = g.db_session  # Get the session from Flask's g object
     crud_operations = CRUDOperations(session)
     
-    # Extract pagination and sorting parameters from the request
-    page = request.args.get('page', default=1, type=int)
-    page_size = request.args.get('page_size', default=10, type=int)
-    sort_by = request.args.get('sort_by', default='created_at', type=str)
-    sort_order = request.args.get('sort_order', default='asc', type=str)
-    
-    # Extract filter parameters from the request
-    filters = {}
-    if 'employment_status' in request.args:
-        filters['employment_status'] = request.args['employment_status']
-    if 'sex' in request.args:
-        filters['sex'] = request.args['sex']
-    if 'marital_status' in request.args:
-        filters['marital_status'] = request.args['marital_status']
-        
     try:
-        # Retrieve applicants from the service with the specified parameters
-        applicants, total_count = ApplicantService(crud_operations).get_all_applicants(
+        # Extract pagination, sorting and filter parameters from the request (MultiDict is read once)
+        args = request.args
+        _get = args.get
+        page, page_size = parse_pagination()
+        sort_by = _get('sort_by', 'created_at')
+        sort_order = _get('sort_order', 'asc')
+        filters = {key: args[key] for key in _APPLICANT_FILTER_KEYS if key in args}
+
+        applicant_service = ApplicantService(crud_operations)
+
+        # Answer conditional requests from a fingerprint of the matching applicants before fetching or serializing anything
+        version = applicant_service.get_applicants_version(filters)
+        etag = compute_etag(version)
+        not_modified = not_modified_response(etag)
+        if not_modified is not None:
+            return not_modified
+
+        # Retrieve applicant rows (read-only, no ORM objects) from the service with the specified parameters
+        applicants, total_count = applicant_service.get_all_applicants_rows(
             page=page, 
             page_size=page_size, 
             sort_by=sort_by, 
@@ -95,7 +146,7 @@ def get_applicants():
         # Use Marshmallow schema to serialize the applicant objects
         # applicant_schema = ApplicantSchema(many=True) # <<< TO BE REMOVED
         # result = applicant_schema.dump(applicants) # <<< TO BE REPLACE BY CUSTOM SERIALIZER
-        result = serialize(applicants) # <<< CUSTOM SERIALIZER
+        result = [_dump_applicant(applicant) for applicant in applicants] # <<< HAND-WRITTEN SERIALIZER (list endpoint hot path)
         
         # Prepare response with pagination metadata
         response = {
@@ -103,20 +154,19 @@ def get_applicants():
             'pagination': {
                 'current_page': page,
                 'page_size': page_size,
-                'total_pages': (total_count // page_size) + (1 if total_count % page_size else 0),
+                'total_pages': total_pages(total_count, page_size),
                 'total_count': total_count
             }
         }
         
-        return jsonify(response), 200
+        list_response = json_response(response, 200)
+        list_response.set_etag(etag)  # Lets clients re-poll with If-None-Match
+        return list_response
     except InvalidPaginationParameterException as e:
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
     except InvalidSortingParameterException as e:
-        return jsonify({'error': str(e)}), 400
-    except SQLAlchemyError as e:  # Specific SQLAlchemy error handling
-        return jsonify({'error': 'Database error occurred', 'details': str(e)}), 500
-    except Exception as e:
-        return jsonify({'error': 'An unexpected error occurred', 'details': str(e)}), 500
+        return json_response({'error': str(e)}, 400)
+    # Database and unexpected errors propagate to the app-level handlers, which roll back the session and log them
 
 @applicants_bp.route('/api/applicants', methods=['POST'])
 @jwt_required()
@@ -130,14 +180,14 @@ def create_applicant():
     applicant_service = ApplicantService(crud_operations)
     try:
         # Extract 'id' from JWT claims to use as created_by_admin_id
-        admin_id = get_jwt_identity()['id']
+        admin_id = current_admin_id()
 
-        # Load and validate request data using Marshmallow schema
-        data = request.json
-        data['created_by_admin_id'] = admin_id  # Overwrite created_by_admin_id to ensure security
+        # Parse the raw request body with orjson; it is validated below
+        data = orjson.loads(request.get_data(cache=False))
         
-        # Deserialize and validate input data
-        applicant_data = ApplicantSchema().load(data)  # <<< TO BE REMOVED (NO NEED TO DESRIALIZE). Use the data directly
+        # Deserialize and validate input data with the shared schema instance
+        applicant_data = _applicant_schema.load(data)
+        applicant_data['created_by_admin_id'] = admin_id  # Overwrite created_by_admin_id to ensure security
         # Extract household members data as a list of dictionaries``
         household_members_data = applicant_data.pop('household_members', []) # <<< HANDLE THE DATA DIRECTLY. Extract household members from the data
 
@@ -153,12 +203,13 @@ def create_applicant():
         response = {
             'data': result
         }
-        return jsonify(response), 201  # Return a 201 Created status code on success
+        return json_response(response, 201)  # Return a 201 Created status code on success
 
-    except ValidationError as err:
-        # Handle validation errors from Marshmallow schema
-        return jsonify({'errors': err.messages}), 400
+    except orjson.JSONDecodeError as e:
+        # Handle a request body that is not valid JSON
+        return json_response({'error': 'Invalid JSON payload', 'details': str(e)}, 400)
 
-    except Exception as e:
-        # General error handler for any unexpected issues
-        return jsonify({'error': 'An unexpected error occurred', 'details': str(e)}), 500
+    except ValidationError as err:
+        # Handle validation errors from the applicant schema
+        return json_response({'errors': err.messages}, 400)
+    # Database and unexpected errors propagate to the app-level handlers, which roll back the session and log them
@@ -49,61 +49,157 @@ By addressing these points, the codebase demonstrates strong adherence to non-fu
 
 # api/routes/applications.py
 
-from flask import Blueprint, request, jsonify, g
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, request, jsonify, g, Response, stream_with_context
+from api.utils.json import json_response, json_bytes
+from flask_jwt_extended import jwt_required
+from api.utils.identity import current_admin_id
+from api.utils.pagination import parse_pagination, parse_cursor_args, total_pages
+from api.utils.etag import compute_etag, not_modified_response
 from bl.services.application_service import ApplicationService
 from api.schemas.all_schemas import ApplicationSchema
 from marshmallow import ValidationError
 from dal.database import Base, engine, SessionLocal
 from dal.crud_operations import CRUDOperations
 from bl.factories.scheme_eligibility_checker_factory import SchemeEligibilityCheckerFactory
-from exceptions import InvalidPaginationParameterException, InvalidSortingParameterException
+from exceptions import InvalidPaginationParameterException, InvalidSortingParameterException, ApplicantNotFoundException, SchemeNotFoundException, AdministratorNotFoundException
 from dal.custom_serializer import serialize
+from config import Config
+from api.schemas.fast_dump import compile_dumper
 
 applications_bp = Blueprint('applications', __name__)
 
+# Built once at import. The creator and the applicant's own applications are not eager-loaded by the listing query, so they are left out
+_dump_application = compile_dumper(ApplicationSchema, exclude=('creator', 'applicant.applications'))
+
+# The eligibility checker factory holds no request state, so one instance serves every request
+_scheme_eligibility_checker_factory = SchemeEligibilityCheckerFactory()
+
+# Pages of at least this many applications are streamed; below it, building the body in one go is cheaper
+_STREAM_MIN_PAGE_SIZE = 50
+
+def _stream_applications(rows, count_applications, page: int, page_size: int):
+    """
+    Yield the JSON body of an applications page piece by piece. The output is byte-for-byte what json_response would 
+    produce for the same page: the data list first, then the pagination metadata once the total count is known.
+
+    Args:
+        rows: Iterator of (application, total count) rows from ApplicationService.iter_all_applications.
+        count_applications: Returns the total count when the page is empty (e.g. past the last page).
+        page (int): The requested page number.
+        page_size (int): The requested page size.
+    """
+    yield b'{"data":['
+    total_count = None
+    separator = b''
+    for application, total_count in rows:
+        yield separator + json_bytes(_dump_application(application))
+        separator = b','
+    if total_count is None:
+        total_count = count_applications()
+    pagination = {
+        'current_page': page,
+        'page_size': page_size,
+        'total_pages': total_pages(total_count, page_size),
+        'total_count': total_count
+    }
+    yield b'],"pagination":' + json_bytes(pagination) + b'}'
+
 @applications_bp.route('/api/applications', methods=['GET'])
 @jwt_required()
 def get_applications():
     session = g.db_session  # Get the session from Flask's g object
     crud_operations = CRUDOperations(session)
     
-    # Extract pagination and sorting parameters from the request
-    page = request.args.get('page', default=1, type=int)
-    page_size = request.args.get('page_size', default=10, type=int)
+    # Extract the sorting parameters from the request
     sort_by = "created_at" # request.args.get('sort_by', default='created_at', type=str)
     sort_order = request.args.get('sort_order', default='asc', type=str)
     
     try: 
-        applications, total_count = ApplicationService(crud_operations).get_all_applications(
-            page=page, 
-            page_size=page_size, 
-            sort_by = "created_at", #sort_by=sort_by, 
-            sort_order=sort_order
-        )
-        
-        # Use Marshmallow schema to serialize the application objects
-        # application_schema = ApplicationSchema(many=True) # <<<TO BE REMOVED
-        # result = application_schema.dump(applications) # <<< TO BE REPLACE BY CUSTOM SERIALIZER
-        result = serialize(applications) # <<< CUSTOM SERIALIZER
-        
-        # Prepare response with pagination metadata
-        response = {
-            'data': result,  # Serialized application objects
-            'pagination': {
-                'current_page': page,
-                'page_size': page_size,
-                'total_pages': (total_count // page_size) + (1 if total_count % page_size else 0),
-                'total_count': total_count
+        # Parse and bound the pagination parameters before any query runs
+        page, page_size = parse_pagination()
+        cursor_args = parse_cursor_args()
+        application_service = ApplicationService(crud_operations)
+
+        if cursor_args is not None:
+            # Keyset mode: one range query per page, with no total count and no fingerprint
+            cursor, limit = cursor_args
+            applications, next_cursor = application_service.get_applications_by_cursor(
+                cursor=cursor, 
+                limit=limit, 
+                sort_order=sort_order
+            )
+            response = {
+                'data': [_dump_application(application) for application in applications],
+                'pagination': {
+                    'limit': limit,
+                    'next_cursor': next_cursor
+                }
             }
-        }
-        return jsonify(response), 200
+            return json_response(response, 200)
+
+        # Answer conditional requests from a fingerprint of the listed data before fetching or serializing anything
+        version = application_service.get_applications_version()
+        etag = compute_etag(version)
+        not_modified = not_modified_response(etag)
+        if not_modified is not None:
+            return not_modified
+
+        if page > 1 and (page - 1) * page_size >= version[0]:
+            # Page past the end: the fingerprint already holds the applications count, so the empty page needs no further query
+            total_count = version[0]
+            response = {
+                'data': [],
+                'pagination': {
+                    'current_page': page,
+                    'page_size': page_size,
+                    'total_pages': total_pages(total_count, page_size),
+                    'total_count': total_count
+                }
+            }
+        elif page_size >= _STREAM_MIN_PAGE_SIZE:
+            # Large page: stream the body while the rows are fetched in batches, instead of building every dict and the whole JSON document first
+            rows, count_applications = application_service.iter_all_applications(
+                page=page, 
+                page_size=page_size, 
+                sort_by = "created_at", #sort_by=sort_by, 
+                sort_order=sort_order
+            )
+            streamed_response = Response(stream_with_context(_stream_applications(rows, count_applications, page, page_size)), 
+                                         status=200, mimetype='application/json')
+            streamed_response.set_etag(etag)  # Lets clients re-poll with If-None-Match
+            return streamed_response
+        else:
+            applications, total_count = application_service.get_all_applications(
+                page=page, 
+                page_size=page_size, 
+                sort_by = "created_at", #sort_by=sort_by, 
+                sort_order=sort_order
+            )
+            
+            # Use Marshmallow schema to serialize the application objects
+            # application_schema = ApplicationSchema(many=True) # <<<TO BE REMOVED
+            # result = application_schema.dump(applications) # <<< TO BE REPLACE BY CUSTOM SERIALIZER
+            result = [_dump_application(application) for application in applications] # <<< COMPILED SCHEMA DUMPER
+            
+            # Prepare response with pagination metadata
+            response = {
+                'data': result,  # Serialized application objects
+                'pagination': {
+                    'current_page': page,
+                    'page_size': page_size,
+                    'total_pages': total_pages(total_count, page_size),
+                    'total_count': total_count
+                }
+            }
+
+        list_response = json_response(response, 200)
+        list_response.set_etag(etag)  # Lets clients re-poll with If-None-Match
+        return list_response
     except InvalidPaginationParameterException as e:
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
     except InvalidSortingParameterException as e:
-        return jsonify({'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'error': 'An unexpected error occurred'}), 500
+        return json_response({'error': str(e)}, 400)
+    # Database and unexpected errors propagate to the app-level handlers, which roll back the session and log them
 
 @applications_bp.route('/api/applications', methods=['POST'])
 @jwt_required()
@@ -111,17 +207,16 @@ def create_application():
     session = g.db_session  # Get the session from Flask's g object
     crud_operations = CRUDOperations(session)
     application_service = ApplicationService(crud_operations)
-    schemeEligibilityCheckerFactory = SchemeEligibilityCheckerFactory(session) 
     try:
          # Extract 'id' from JWT claims to use as created_by_admin_id
-        admin_id = get_jwt_identity()['id']
+        admin_id = current_admin_id()
 
         # Load and validate request data using Marshmallow schema
         data = request.json
         data["created_by_admin_id"] = admin_id
         # ApplicationSchema().load(data) # Input validations <<< TO BE REMOVED (NO NEED TO DESRIALIZE)
         
-        application = application_service.create_application(data.get('applicant_id'), data.get('scheme_id'), admin_id, schemeEligibilityCheckerFactory)
+        application = application_service.create_application(data.get('applicant_id'), data.get('scheme_id'), admin_id, _scheme_eligibility_checker_factory)
         # application_data_serialized = ApplicationSchema().dump(application) # <<< TO BE REMOVED
         result = serialize(application) # <<< CUSTOM SERIALIZER
         response = {
@@ -137,3 +232,35 @@ def create_application():
         # This will catch any other exceptions that are not handled above
         print("An unexpected error occurred.")
         return jsonify({'error': 'An unexpected error occurred.'}), 500
+
+@applications_bp.route('/api/applications/bulk', methods=['POST'])
+@jwt_required()
+def create_applications_bulk():
+    """
+    Create the applications of a list of (applicant_id, scheme_id) pairs in one transaction, instead of one request and one commit per 
+    application. Pairs that create_application would refuse (already approved, invalid data) are reported under 'skipped'.
+    """
+    session = g.db_session  # Get the session from Flask's g object
+    crud_operations = CRUDOperations(session)
+    application_service = ApplicationService(crud_operations)
+    try:
+        admin_id = current_admin_id()
+
+        data = request.get_json(silent=True)
+        if not isinstance(data, list) or not data:
+            return json_response({'error': 'The request body must be a non-empty list of applications.'}, 400)
+        if len(data) > Config.MAX_BULK_APPLICATIONS:
+            return json_response({'error': f'A bulk request must not contain more than {Config.MAX_BULK_APPLICATIONS} applications.'}, 400)
+        if not all(isinstance(item, dict) and type(item.get('applicant_id')) is int and type(item.get('scheme_id')) is int for item in data):
+            return json_response({'error': 'Each application must have an integer applicant_id and scheme_id.'}, 400)
+
+        pairs = [(item['applicant_id'], item['scheme_id']) for item in data]
+        applications, skipped = application_service.create_applications_for_pairs(pairs, admin_id, _scheme_eligibility_checker_factory)
+        response = {
+            'data': serialize(applications),
+            'skipped': [{'applicant_id': applicant_id, 'scheme_id': scheme_id, 'error': reason} for (applicant_id, scheme_id), reason in skipped.items()]
+        }
+        return json_response(response, 201)
+    except (ApplicantNotFoundException, SchemeNotFoundException, AdministratorNotFoundException) as e:
+        return json_response({'error': str(e)}, 400)
+    # Database and unexpected errors propagate to the app-level handlers, which roll back the session and log them
@@ -0,0 +1,36 @@
+# Copyright (c) 2024 by Jonathan AW
+# api/routes/health.py
+
+"""
+Health check endpoints for load balancers and load tests.
+
+/health/db checks a connection out of the API's connection pool and runs SELECT 1 through it. The endpoint is unauthenticated, so 
+it answers with the status alone; the database error, and the pool's occupancy for observing the DB_POOL_SIZE / DB_MAX_OVERFLOW 
+sizing under load, are written to the server log instead.
+"""
+
+import logging
+from flask import Blueprint, g
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from api.utils.json import json_response
+
+logger = logging.getLogger(__name__)
+
+health_bp = Blueprint('health', __name__)
+
+@health_bp.route('/health/db', methods=['GET'])
+def db_health():
+    """
+    Check that the database is reachable through the connection pool.
+    Unauthenticated, and reads no application data.
+    """
+    session = g.db_session  # Get the session from Flask's g object
+    try:
+        session.execute(text('SELECT 1'))
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.error("Database health check failed: %s", e)
+        return json_response({'status': 'unavailable'}, 503)
+    logger.debug("Database connection pool: %s", session.get_bind().pool.status())
+    return json_response({'status': 'ok'}, 200)
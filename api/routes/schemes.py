@@ -50,7 +50,8 @@ By addressing these points, the codebase demonstrates strong adherence to non-fu
 
 # api/routes/schemes.py
 
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, request, g, Response
+from api.utils.json import json_response
 from flask_jwt_extended import jwt_required
 from bl.services.scheme_service import SchemeService
 from api.schemas.all_schemas import SchemeSchema
@@ -59,12 +60,61 @@ from dal.crud_operations import CRUDOperations
 from bl.factories.scheme_eligibility_checker_factory import SchemeEligibilityCheckerFactory
 from bl.schemes.schemes_manager import SchemesManager
 from bl.services.applicant_service import ApplicantService
-from sqlalchemy.exc import SQLAlchemyError
 from exceptions import InvalidPaginationParameterException, InvalidSortingParameterException, ApplicantNotFoundException
-from dal.custom_serializer import serialize
+from api.schemas.fast_dump import compile_dumper
+from api.utils.pagination import parse_pagination, parse_cursor_args, total_pages
+from api.utils.etag import compute_etag, not_modified_response
+from utils.ttl_cache import TTLCache
+from datetime import datetime
+from typing import NamedTuple, Optional
 
 schemes_bp = Blueprint('schemes', __name__)
 
+_dump_scheme = compile_dumper(SchemeSchema) # Built once at import; emits the same keys as SchemeSchema().dump()
+
+# The eligibility checker factory holds no request state, so one instance serves every request
+_scheme_eligibility_checker_factory = SchemeEligibilityCheckerFactory()
+
+# Encoded schemes listing bodies, keyed by their ETag (a hash of the matching schemes' version and the request's path and query string)
+_schemes_page_cache = TTLCache(maxsize=256, ttl=60)
+
+# Eligible-schemes responses, keyed by the applicant's eligibility inputs and the version of the valid schemes
+_eligibility_cache = TTLCache(maxsize=1024, ttl=300)
+
+class SchemeSnapshot(NamedTuple):
+    """
+    Immutable copy of a Schemes row. It carries every attribute the eligibility strategies and _dump_scheme read, 
+    and is bound to no session, so it can be shared across requests and threads.
+    """
+    id: int
+    name: str
+    description: str
+    eligibility_criteria: dict
+    benefits: dict
+    validity_start_date: datetime
+    validity_end_date: Optional[datetime]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+# Snapshots of the valid schemes the eligibility checks run against, keyed by the valid schemes' version
+_valid_schemes_cache = TTLCache(maxsize=8, ttl=300)
+
+# Applicant and household member attributes the eligibility strategies read
+_APPLICANT_ELIGIBILITY_FIELDS = ('name', 'sex', 'date_of_birth', 'employment_status', 'employment_status_change_date', 'marital_status', 'marriage_date')
+_MEMBER_ELIGIBILITY_FIELDS = ('name', 'relation', 'sex', 'date_of_birth', 'employment_status')
+
+def _eligibility_cache_key(applicant, schemes_version) -> tuple:
+    """
+    Build the cache key of an applicant's eligible-schemes response from the values the eligibility checks depend on.
+    Any change to the applicant, their household or the valid schemes (including the passing of a day) yields a new key.
+    """
+    return (
+        applicant.id,
+        tuple(getattr(applicant, field) for field in _APPLICANT_ELIGIBILITY_FIELDS),
+        tuple(tuple(getattr(member, field) for field in _MEMBER_ELIGIBILITY_FIELDS) for member in applicant.household_members),
+        schemes_version,
+    )
+
 @schemes_bp.route('/api/schemes', methods=['GET'])
 @jwt_required()
 def get_schemes():
@@ -76,9 +126,8 @@ def get_schemes():
     scheme_service = SchemeService(crud_operations)
 
     try:
-        # Get pagination parameters from the request
-        page = request.args.get('page', default=1, type=int)
-        per_page = request.args.get('per_page', default=10, type=int)
+        # Parse and bound the pagination parameters before any query runs
+        page, per_page = parse_pagination('per_page')
 
         # Get the fetch_valid_schemes parameter from the request
         fetch_valid_schemes = request.args.get('fetch_valid_schemes', 'true').lower() == 'true'
@@ -90,77 +139,120 @@ def get_schemes():
         if 'validity_end_date' in request.args:
             filters['validity_end_date'] = request.args['validity_end_date']
 
-        # Retrieve schemes with pagination and filtering
-        schemes, total_count = scheme_service.get_schemes_by_filters(
-            filters=filters, 
-            fetch_valid_schemes=fetch_valid_schemes, 
-            page=page, 
-            per_page=per_page
-        )
+        cursor_args = parse_cursor_args(default_limit=per_page)
 
-        # Serialize the scheme objects using Marshmallow schema
-        # scheme_schema = SchemeSchema(many=True) # <<< TO BE REMOVED
-        # result = scheme_schema.dump(schemes) # <<< TO BE REPLACE BY CUSTOM SERIALIZER
-        # Serialize the scheme objects using the custom serializer
-        result = serialize(schemes) # <<< CUSTOM SERIALIZER 
+        # Answer conditional requests from a fingerprint of the matching schemes before fetching or serializing anything
+        etag = compute_etag(scheme_service.get_schemes_version(filters, fetch_valid_schemes))
+        not_modified = not_modified_response(etag)
+        if not_modified is not None:
+            return not_modified
 
-        response = {
-            'data': result,
-            'pagination': {
-                'current_page': page,
-                'per_page': per_page,
-                'total_schemes': total_count,
-                'total_pages': (total_count + per_page - 1) // per_page
+        # Serve a page already built for another client from the encoded body; the ETag changes whenever the data does
+        body = _schemes_page_cache.get(etag)
+        if body is not None:
+            cached_response = Response(body, status=200, mimetype='application/json')
+            cached_response.set_etag(etag)
+            return cached_response
+
+        if cursor_args is not None:
+            # Keyset mode: one range query per page and no total count
+            cursor, limit = cursor_args
+            schemes, next_cursor = scheme_service.get_schemes_by_cursor(
+                filters=filters, 
+                fetch_valid_schemes=fetch_valid_schemes, 
+                cursor=cursor, 
+                limit=limit
+            )
+            response = {
+                'data': [_dump_scheme(scheme) for scheme in schemes],
+                'pagination': {
+                    'limit': limit,
+                    'next_cursor': next_cursor
+                }
             }
-        }
-        return jsonify(response), 200
+        else:
+            # Retrieve schemes with pagination and filtering, as plain rows rather than ORM objects
+            # The Schemes columns are exactly the SchemeSchema fields, in the same order, so the rows are the serialized schemes
+            result, total_count = scheme_service.get_schemes_rows_by_filters(
+                filters=filters, 
+                fetch_valid_schemes=fetch_valid_schemes, 
+                page=page, 
+                per_page=per_page
+            )
+
+            response = {
+                'data': result,
+                'pagination': {
+                    'current_page': page,
+                    'per_page': per_page,
+                    'total_schemes': total_count,
+                    'total_pages': total_pages(total_count, per_page)
+                }
+            }
+
+        list_response = json_response(response, 200)
+        list_response.set_etag(etag)  # Lets clients re-poll with If-None-Match
+        _schemes_page_cache.set(etag, list_response.get_data())
+        return list_response
     except InvalidPaginationParameterException as e:
-        return jsonify({'error': str(e)}), 400
+        return json_response({'error': str(e)}, 400)
     except InvalidSortingParameterException as e:
-        return jsonify({'error': str(e)}), 400
-    except SQLAlchemyError as e:
-        # Specific SQLAlchemy error handling
-        return jsonify({'error': 'Database error occurred', 'details': str(e)}), 500
-
-    except Exception as e:
-        # General error handler
-        return jsonify({'error': 'An unexpected error occurred', 'details': str(e)}), 500
+        return json_response({'error': str(e)}, 400)
+    # Database and unexpected errors propagate to the app-level handlers, which roll back the session and log them
 
 
     
 @schemes_bp.route('/api/schemes/eligible', methods=['GET'])
 @jwt_required()
 def get_eligible_schemes():
-    applicant_id = request.args.get('applicant')
-    if not applicant_id:
-        return jsonify({"error": "applicant id is required"}), 400
+    applicant_arg = request.args.get('applicant')
+    if not applicant_arg:
+        return json_response({"error": "applicant id is required"}, 400)
     
-    if not applicant_id.isdigit():  # Add validation for applicant_id
-        return jsonify({"error": "Invalid applicant id format"}), 400
+    # Parse the applicant id once; the integer is passed down to the service and the DAL
+    try:
+        applicant_id = int(applicant_arg)
+    except ValueError:
+        return json_response({"error": "Invalid applicant id format"}, 400)
+    if applicant_id < 0:
+        return json_response({"error": "Invalid applicant id format"}, 400)
 
     session = g.db_session  # Get the session from Flask's g object
     crud_operations = CRUDOperations(session)
     try:
         applicant = ApplicantService(crud_operations).get_applicant_by_id(applicant_id)
         if not applicant:  # Handle case where applicant is not found
-            return jsonify({"error": "Applicant not found"}), 404
+            return json_response({"error": "Applicant not found"}, 404)
+
+        # Reuse the result of an identical check: same applicant inputs against the same valid schemes
+        scheme_service = SchemeService(crud_operations)
+        schemes_version = scheme_service.get_schemes_version({}, True)
+        cache_key = _eligibility_cache_key(applicant, schemes_version)
+        response = _eligibility_cache.get(cache_key)
+        if response is not None:
+            return json_response(response, 200)
+
+        # Check against the snapshot of the valid schemes taken by an earlier request, as long as they have not changed since
+        valid_schemes = _valid_schemes_cache.get(schemes_version)
+        if valid_schemes is None:
+            # Read as plain rows, so the snapshot holds data rather than ORM instances of this request's session
+            scheme_rows, _ = scheme_service.get_schemes_rows_by_filters({}, True)
+            valid_schemes = tuple(SchemeSnapshot(**row) for row in scheme_rows)
+            _valid_schemes_cache.set(schemes_version, valid_schemes)
 
-        schemeEligibilityCheckerFactory = SchemeEligibilityCheckerFactory(session)
-        scheme_manager = SchemesManager(crud_operations, schemeEligibilityCheckerFactory)
+        scheme_manager = SchemesManager(crud_operations, _scheme_eligibility_checker_factory)
         
-        eligibility_results, eligible_schemes = scheme_manager.check_schemes_eligibility_for_applicant({}, True, applicant)
+        eligibility_results, eligible_schemes = scheme_manager.check_eligibility_against_schemes(valid_schemes, applicant)
         # scheme_schema = SchemeSchema(many=True) # <<< TO BE REMOVED
         # eligible_schemes_Serialized = scheme_schema.dump(eligible_schemes) # <<< TO BE REPLACE BY CUSTOM SERIALIZER
-        e_schemes = serialize(eligible_schemes) # <<< CUSTOM SERIALIZER  
+        e_schemes = [_dump_scheme(scheme) for scheme in eligible_schemes] # <<< COMPILED SCHEMA DUMPER  
         eligibility_reports_list = [result.report for result in eligibility_results] # Extracts the EligilibityResult.report from each result 
         response = {
             'data': {"eligible_schemes": e_schemes, "eligibility_results": eligibility_reports_list}  
         }
-        return jsonify(response), 200
+        _eligibility_cache.set(cache_key, response)
+        return json_response(response, 200)
     except ApplicantNotFoundException as e:
-        return jsonify({'error': str(e)}), 404  # Handle specific exception
-    except SQLAlchemyError as e:  # Specific SQLAlchemy error handling
-        return jsonify({'error': 'Database error occurred', 'details': str(e)}), 500
-    except Exception as e:
-        return jsonify({'error': 'An unexpected error occurred', 'details': str(e)}), 500    
+        return json_response({'error': str(e)}, 404)  # Handle specific exception
+    # Database and unexpected errors propagate to the app-level handlers, which roll back the session and log them
  
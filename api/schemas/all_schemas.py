@@ -75,7 +75,7 @@ class ApplicationSchema(Schema):
     scheme_id = fields.Int(required=True)
     status = fields.Str(required=True, dump_only=True, validate=validate.OneOf(["pending", "approved", "rejected"]))
     eligibility_verdict = fields.Str(validate=validate.Length(max=1000), dump_only=True)  
-    awarded_benefits = fields.Dict(dump_only=True)  
+    awarded_benefits = fields.Raw(dump_only=True)  # Stored as JSON; a list of awarded benefits
     submission_date = fields.DateTime(dump_only=True)
     created_by_admin_id = fields.Int(required=True)
     created_at = fields.DateTime(dump_only=True)
@@ -0,0 +1,76 @@
+# Copyright (c) 2024 by Jonathan AW
+# api/schemas/fast_dump.py
+
+"""
+Compiled dump functions for Marshmallow schemas.
+
+Schema.dump() resolves attribute names, data keys, hooks and nested schemas for every object it serializes. 
+For the list endpoints that is the dominant serialization cost. compile_dumper() walks a schema's dump fields once, 
+binds each field to the attribute it reads, and returns a plain function that serializes one object. 
+The result is memoized per (schema class, only, exclude), so each dumper is built once per process.
+
+Field values are still converted by the Marshmallow fields themselves (Field._serialize), except for ISO-format DateTime fields: 
+their datetime values are passed through as-is and formatted by orjson in C when the response is encoded, which produces the same 
+ISO 8601 strings. The encoded output therefore matches Schema.dump() for schemas without pre/post-dump hooks.
+"""
+
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Optional, Tuple
+from marshmallow import Schema, fields
+
+
+@lru_cache(maxsize=None)
+def compile_dumper(schema_cls: type, only: Optional[Tuple[str, ...]] = None, exclude: Tuple[str, ...] = ()) -> Callable[[object], dict]:
+    """
+    Build (once) a function that serializes a single object with the given schema.
+
+    Args:
+        schema_cls (type): The Marshmallow Schema class.
+        only (Optional[Tuple[str, ...]]): Field names to include. Dotted names select fields of nested schemas.
+        exclude (Tuple[str, ...]): Field names to exclude. Dotted names exclude fields of nested schemas.
+
+    Returns:
+        Callable[[object], dict]: Serializes one object into a dictionary, like schema_cls(only=only, exclude=exclude).dump(obj).
+    """
+    return _compile(schema_cls(only=only, exclude=exclude))
+
+
+def _compile(schema: Schema) -> Callable[[object], dict]:
+    """
+    Compile a schema instance (with only/exclude already applied) into a dump function.
+    """
+    getters = []
+    for name, field in schema.dump_fields.items():
+        key = field.data_key or name
+        attribute = field.attribute or name
+        if isinstance(field, fields.Nested):
+            getters.append((key, _nested_getter(attribute, _compile(field.schema), field.many)))
+        elif type(field) is fields.DateTime and (field.format or field.DEFAULT_FORMAT) == 'iso':
+            getters.append((key, attrgetter(attribute)))  # Left for orjson to format
+        else:
+            getters.append((key, _field_getter(attribute, field)))
+
+    def dump_one(obj) -> dict:
+        return {key: getter(obj) for key, getter in getters}
+    return dump_one
+
+
+def _field_getter(attribute: str, field: fields.Field) -> Callable[[object], object]:
+    serialize = field._serialize
+
+    def get(obj):
+        return serialize(getattr(obj, attribute), attribute, obj)
+    return get
+
+
+def _nested_getter(attribute: str, dump_one: Callable[[object], dict], many: bool) -> Callable[[object], object]:
+    if many:
+        def get(obj):
+            value = getattr(obj, attribute)
+            return None if value is None else [dump_one(item) for item in value]
+    else:
+        def get(obj):
+            value = getattr(obj, attribute)
+            return None if value is None else dump_one(value)
+    return get
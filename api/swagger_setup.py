@@ -1,9 +1,13 @@
 # Copyright (c) 2024 by Jonathan AW
 
 #swagger_setup.py
-from flask import send_from_directory
+import hashlib
+import os
+from flask import Response, request
 from flask_swagger_ui import get_swaggerui_blueprint
 
+OPENAPI_MAX_AGE = 300  # Seconds clients may reuse the OpenAPI specification without revalidating it
+
 def init_swagger_ui(app):
     """
     Initialize Swagger UI and serve OpenAPI documentation.
@@ -21,10 +25,18 @@ def init_swagger_ui(app):
 
     app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
 
+    # The specification only changes with a deployment, so it is read and fingerprinted once at startup
+    with open(os.path.join(app.root_path, '..', 'docs', 'openapi.yaml'), 'rb') as openapi_file:
+        openapi_bytes = openapi_file.read()
+    openapi_etag = hashlib.sha1(openapi_bytes).hexdigest()
+
     @app.route('/openapi.yaml', methods=['GET'])
     def serve_openapi_yaml():
         """
-        Serve the OpenAPI specification YAML file.
+        Serve the OpenAPI specification YAML file from memory, answering 304 Not Modified when the client's copy is current.
         """
-        return send_from_directory('../docs', 'openapi.yaml')
-
+        response = Response(openapi_bytes, mimetype='application/yaml')
+        response.set_etag(openapi_etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = OPENAPI_MAX_AGE
+        return response.make_conditional(request)
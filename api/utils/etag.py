@@ -0,0 +1,44 @@
+# Copyright (c) 2024 by Jonathan AW
+# etag.py
+
+"""
+Conditional (ETag / If-None-Match) responses for the list endpoints.
+
+A list route asks the DAL for a cheap version fingerprint of the rows it would return (counts and latest change times),
+hashes it together with the request's path and query string, and answers 304 Not Modified when the client already
+holds that representation. The page query, serialization and JSON encoding are skipped entirely on a match.
+"""
+
+import hashlib
+from typing import Optional
+from flask import request, Response
+
+
+def compute_etag(version) -> str:
+    """
+    Build the ETag of the current list request.
+
+    Args:
+        version: The data fingerprint returned by the DAL; anything with a stable str().
+
+    Returns:
+        str: A 32-character hex digest of the fingerprint and the request's full path (including the query string).
+    """
+    return hashlib.blake2b(f'{version}|{request.full_path}'.encode(), digest_size=16).hexdigest()
+
+
+def not_modified_response(etag: str) -> Optional[Response]:
+    """
+    Answer the current request with 304 Not Modified if the client's If-None-Match header matches the ETag.
+
+    Args:
+        etag (str): The ETag of the representation the request would return.
+
+    Returns:
+        Optional[Response]: An empty 304 response carrying the ETag, or None if the full response must be built.
+    """
+    if not request.if_none_match.contains(etag):
+        return None
+    not_modified = Response(status=304)
+    not_modified.set_etag(etag)
+    return not_modified
@@ -0,0 +1,27 @@
+# Copyright (c) 2024 by Jonathan AW
+# identity.py
+
+"""
+Request-scoped access to the authenticated administrator.
+
+@jwt_required() already verifies and decodes the access token and keeps the claims on Flask's request context. 
+current_admin_id() reads the administrator's ID from those claims once per request and caches it on g, 
+so routes and helpers that need it share a single lookup instead of each calling get_jwt_identity().
+"""
+
+from flask import g
+from flask_jwt_extended import get_jwt_identity
+
+
+def current_admin_id() -> int:
+    """
+    Return the ID of the administrator identified by the request's JWT.
+    Must be called from within a @jwt_required() route.
+
+    Returns:
+        int: The administrator ID stored in the token identity.
+    """
+    admin_id = g.get('admin_id')
+    if admin_id is None:
+        admin_id = g.admin_id = get_jwt_identity()['id']
+    return admin_id
@@ -0,0 +1,62 @@
+# Copyright (c) 2024 by Jonathan AW
+# json.py
+
+"""
+JSON encoding backed by orjson.
+
+Flask's default JSON provider encodes with the stdlib json module. The list endpoints return pages of hundreds of 
+serialized rows, so responses are encoded with orjson instead, which is several times faster for this kind of payload.
+OrjsonProvider is installed as the app's JSON provider, so jsonify and request.get_json go through orjson as well.
+"""
+
+import orjson
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+# OPT_NON_STR_KEYS: Marshmallow error messages key nested list errors by integer index
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def json_bytes(payload) -> bytes:
+    """
+    Encode a payload exactly as json_response does, for responses assembled from several encoded parts.
+
+    Args:
+        payload: A JSON-serializable value. Values orjson cannot encode natively fall back to str().
+
+    Returns:
+        bytes: The UTF-8 JSON encoding of the payload.
+    """
+    return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS)
+
+
+def json_response(payload, status: int = 200) -> Response:
+    """
+    Build a JSON response with orjson instead of Flask's stdlib-based jsonify.
+
+    Args:
+        payload: A JSON-serializable dict or list. Values orjson cannot encode natively fall back to str().
+        status (int): The HTTP status code of the response.
+
+    Returns:
+        Response: A Flask response with an application/json mimetype.
+    """
+    return Response(json_bytes(payload), status=status, mimetype='application/json')
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes and decodes with orjson, with the same options as json_response.
+
+    Keys keep their insertion order and responses are always compact, as with json_response.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return json_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(json_bytes(obj), mimetype=self.mimetype)
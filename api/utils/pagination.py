@@ -0,0 +1,86 @@
+# Copyright (c) 2024 by Jonathan AW
+# pagination.py
+
+"""
+Query-string parsing for the pagination of the list endpoints.
+
+Page and page-size arguments are parsed and bounds-checked once at the API edge, so a request for an absurd page size
+is rejected before any query runs. Config.MAX_PAGE_SIZE caps the rows (and serialization work) of a single response.
+
+A list request opts into the keyset (cursor) mode by passing `limit` and/or `cursor` instead of `page`. The cursor is
+the opaque `next_cursor` value returned with the previous page; each page is then a single indexed range query with
+no COUNT(*). Requests without these arguments keep the page-number mode and its total counts.
+"""
+
+from typing import Optional, Tuple
+from flask import request
+from config import Config
+from exceptions import InvalidPaginationParameterException
+
+
+def _check_page_size(page_size: int) -> int:
+    """
+    Reject page sizes outside 1..Config.MAX_PAGE_SIZE.
+    """
+    if page_size < 1:
+        raise InvalidPaginationParameterException("Page size must be greater than 0.")
+    if page_size > Config.MAX_PAGE_SIZE:
+        raise InvalidPaginationParameterException(f"Page size must not exceed {Config.MAX_PAGE_SIZE}.")
+    return page_size
+
+
+def parse_pagination(page_size_arg: str = 'page_size', default_page_size: int = 10) -> Tuple[int, int]:
+    """
+    Parse and validate the page-number pagination arguments of the current request.
+
+    Args:
+        page_size_arg (str): The name of the page size query argument ('page_size' or 'per_page').
+        default_page_size (int): The page size used when the argument is absent.
+
+    Returns:
+        Tuple[int, int]: (page, page_size).
+
+    Raises:
+        InvalidPaginationParameterException: If an argument is not an integer or is out of range.
+    """
+    args = request.args
+    try:
+        page = int(args.get('page', 1))
+        page_size = int(args.get(page_size_arg, default_page_size))
+    except ValueError:
+        raise InvalidPaginationParameterException("Page number and page size must be integers.")
+    if page < 1:
+        raise InvalidPaginationParameterException("Page number must be greater than 0.")
+    return page, _check_page_size(page_size)
+
+
+def parse_cursor_args(default_limit: int = 10) -> Optional[Tuple[Optional[int], int]]:
+    """
+    Parse the cursor pagination arguments of the current request.
+
+    Args:
+        default_limit (int): The page size used when only a cursor is given.
+
+    Returns:
+        Optional[Tuple[Optional[int], int]]: (cursor, limit), where cursor is None for the first page,
+        or None if the request does not use cursor pagination.
+
+    Raises:
+        InvalidPaginationParameterException: If the cursor or limit is not an integer, or the limit is out of range.
+    """
+    args = request.args
+    if 'cursor' not in args and 'limit' not in args:
+        return None
+    try:
+        cursor = int(args['cursor']) if args.get('cursor') else None
+        limit = int(args.get('limit', default_limit))
+    except ValueError:
+        raise InvalidPaginationParameterException("Cursor and limit must be integers.")
+    return cursor, _check_page_size(limit)
+
+
+def total_pages(total_count: int, page_size: int) -> int:
+    """
+    Number of pages needed to list total_count items, page_size at a time.
+    """
+    return -(-total_count // page_size)  # Ceiling division
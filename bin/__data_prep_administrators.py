@@ -15,7 +15,7 @@ import os
 # Add the project root directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dal.database import Base, engine, SessionLocal
+from dal.database import Base, SessionLocal
 from dal.models import Administrator, Applicant, HouseholdMember, Scheme, Application, SystemConfiguration
 from dal.crud_operations import CRUDOperations
 from bl.services.administrator_service import AdministratorService
@@ -23,9 +23,6 @@ from dotenv import load_dotenv
 from environs import Env
 load_dotenv()
 
-connection = engine.connect()
-session = SessionLocal(bind=connection)
-crud_operations = CRUDOperations(session)
 ADMIN_USER_NAME = Env().str("ADMIN_USER_NAME", "ADMIN_USER_NAME is not set.")
 ADMIN_USER_PASSWORD = Env().str("ADMIN_USER_PASSWORD", "ADMIN_USER_PASSWORD is not set.")
 ADMIN_USER_NAME__2 = Env().str("ADMIN_USER_NAME__2", "ADMIN_USER_NAME__2 is not set.")
@@ -62,9 +59,8 @@ def provision_administrators(crud_operations) -> int:
 
 if __name__ == "__main__":
     print("Provisioning Administrator Accounts...\n")
-    i = provision_administrators(crud_operations)
-    session.close()
-    connection.close()
+    with SessionLocal() as session:
+        i = provision_administrators(CRUDOperations(session))
     print(f"{i}x Administrator Accounts created successfully.")
     print("Please note down these credentials for testing purposes.")
     print("This script is run only ONCE when the System is deployed to staging.")
@@ -16,8 +16,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+import atexit
 import logging
-from dal.database import engine, SessionLocal
+import shutil
+from logging.handlers import MemoryHandler
+from dal.database import SessionLocal
 from dal.crud_operations import CRUDOperations
 from bl.services.application_service import ApplicationService
 from bl.factories.scheme_eligibility_checker_factory import SchemeEligibilityCheckerFactory
@@ -36,17 +39,38 @@ try:
 except:
     PROVISION_DUMMY_APPLICATIONS = True # Default to True if not set
     
-connection = engine.connect()
-session = SessionLocal(bind=connection)
-    
-# Setup logging
-logging.basicConfig(filename='application_creation.log', level=logging.INFO,
-                    format='%(asctime)s - %(levelname)s - %(message)s')
+APPLICANTS_BATCH_SIZE = 500  # Applicants whose applications are evaluated and committed together
+
+LOG_BUFFER_CAPACITY = 1024  # Records buffered before the log file is written
+
+
+def setup_logging():
+    """
+    Log to application_creation.log. Records are buffered in memory and written to the log file in batches, rather than one write per 
+    application; errors are written out at once, together with the records buffered before them. (The handlers are wired explicitly 
+    because importing the api package has already configured the root logger, which turns logging.basicConfig into a no-op.)
+    """
+    log_file_handler = logging.FileHandler('application_creation.log')
+    log_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    log_buffer = MemoryHandler(capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=log_file_handler)
+    logging.getLogger().addHandler(log_buffer)
+    logging.getLogger().setLevel(logging.INFO)
+    atexit.register(log_buffer.flush)
+
+def flush_logs():
+    """
+    Write out the log records still buffered in memory.
+    """
+    for handler in logging.getLogger().handlers:
+        handler.flush()
 
 
-def create_applications_business_layer():
+def create_applications_business_layer(session):
     """
     Create application records using the Business Layer code.
+
+    Args:
+        session (Session): The database session to create the applications with.
     """
     # Database setup
     
@@ -58,25 +82,27 @@ def create_applications_business_layer():
     applicant_service = ApplicantService(crud_operations)
     schemes_service = SchemeService(crud_operations)
     
-    # Fetch all applicants and schemes from the database
-    applicants, totalCount = applicant_service.get_all_applicants()
+    # Fetch all schemes from the database; the applicants are streamed in batches, so memory use does not grow with their number
     schemes = schemes_service.get_all_schemes()
 
-    for applicant in applicants:
-        for scheme in schemes:
-            try:
-                
-                # Create application using the business logic layer
-                application = application_service.create_application(
-                    applicant_id=applicant.id,
-                    scheme_id=scheme.id,
-                    created_by_admin_id=creator.id,  
-                    schemeEligibilityCheckerFactory=scheme_eligibility_checker_factory
-                )
-                logging.info(f"Application [{application.id}] created for Applicant [{applicant.id}] and Scheme [{scheme.id}] -Status: [{application.status}] -Eligibility: [{application.eligibility_verdict}] -Benefit: [{application.awarded_benefits}]")
-                
-            except Exception as e:
-                logging.error(f"Error creating application for Applicant {applicant.id} and Scheme {scheme.id}: {str(e)}")
+    try:
+        # Create the applications of every applicant for every scheme using the business logic layer, in one transaction per batch
+        for applicants in applicant_service.iter_applicants_with_household(APPLICANTS_BATCH_SIZE):
+            applications, skipped = application_service.create_applications_for_applicants(
+                applicants=applicants,
+                schemes=schemes,
+                created_by_admin_id=creator.id,  
+                schemeEligibilityCheckerFactory=scheme_eligibility_checker_factory
+            )
+            for application in applications:
+                logging.info(f"Application [{application.id}] created for Applicant [{application.applicant_id}] and Scheme [{application.scheme_id}] -Status: [{application.status}] -Eligibility: [{application.eligibility_verdict}] -Benefit: [{application.awarded_benefits}]")
+            for (applicant_id, scheme_id), reason in skipped.items():
+                logging.error(f"Error creating application for Applicant {applicant_id} and Scheme {scheme_id}: {reason}")
+        
+    except Exception as e:
+        logging.error(f"Error creating applications: {str(e)}")
+    finally:
+        flush_logs()
 
 def create_applications_api():
     """
@@ -105,34 +131,33 @@ def create_applications_api():
         schemes = response.get_json()
 
         
-        for applicant in applicants["data"]:
-            for scheme in schemes["data"]:
-                try:
-                    
-                    # Prepare request data for the API
-                    data = {
-                        "applicant_id": applicant["id"],
-                        "scheme_id": scheme["id"],
-                    }
-                    response = test_client.post('/api/applications', json=data, headers={'Authorization': f'Bearer {access_token}'})
-                    data = response.get_json()
-                    if response.status_code == 201:
-                        logging.info(f"Application created successfully for Applicant [{applicant['name']}] for Scheme [{scheme['name']}].")
-                    else:
-                        logging.error(f"Failed to create application via API for Applicant [{applicant['name']}] for Scheme [{scheme['name']}]: {response.text}")
-                
-                except Exception as e:
-                    logging.error(f"Error creating application via API for Applicant [{applicant['name']}] and Scheme [{scheme['name']}]: {str(e)}")
+        # Create the applications of every applicant for every scheme with one bulk request
+        data = [{"applicant_id": applicant["id"], "scheme_id": scheme["id"]} for applicant in applicants["data"] for scheme in schemes["data"]]
+        try:
+            response = test_client.post('/api/applications/bulk', json=data, headers={'Authorization': f'Bearer {access_token}'})
+            result = response.get_json()
+            if response.status_code == 201:
+                for application in result["data"]:
+                    logging.info(f"Application created successfully for Applicant [{application['applicant']['name']}] for Scheme [{application['scheme']['name']}].")
+                for skipped in result["skipped"]:
+                    logging.error(f"Failed to create application via API for Applicant [{skipped['applicant_id']}] for Scheme [{skipped['scheme_id']}]: {skipped['error']}")
+            else:
+                logging.error(f"Failed to create applications via API: {response.text}")
+        
+        except Exception as e:
+            logging.error(f"Error creating applications via API: {str(e)}")
 
 def generate_batch_run_report():
     """
     Generate a report summarizing the results of the application creation process.
     """
     # This is a placeholder. You can customize it as needed.
-    print("Batch run report:")
-    with open('application_creation.log', 'r') as log_file:
-        for line in log_file:
-            print(line.strip())
+    print("Batch run report:", flush=True)
+    flush_logs()  # Write out the records still buffered in memory first
+    # Copy the log to stdout in large blocks rather than printing it line by line
+    with open('application_creation.log', 'rb') as log_file:
+        shutil.copyfileobj(log_file, sys.stdout.buffer)
+    sys.stdout.buffer.flush()
 
 if __name__ == "__main__":
     # mode = input("Select mode of operation (1 for Business Layer Code Mode, 2 for API Endpoint Mode): ")
@@ -143,13 +168,12 @@ if __name__ == "__main__":
     #     create_applications_api()
     # else:
     #     print("Invalid mode selected. Please choose 1 or 2.")
+    setup_logging()
     print("Provisioning Applications for all existing Applicants for all supported schemes..\n")
     print ("This script is not idempotent. Running this script each time will create 1 set of additional applications for each applicant for each scheme in the database.\nApplicants are allowed to apply for a scheme multiple times if they were not successful in the previous applications.\nSuccessful applicants will not be allowed to reapply.\n")
-    create_applications_business_layer() 
-    
-    # Close the session and connection
-    session.close()
-    connection.close()
+    # Objects are kept loaded across the per-batch commits, so the schemes are not re-read for every batch
+    with SessionLocal(expire_on_commit=False) as session:
+        create_applications_business_layer(session)
 
     # Generate the batch run report
     # generate_batch_run_report()
@@ -11,20 +11,21 @@
 
 import sys
 import os
+import time
 
 from sqlalchemy import Null
 
 # Add the project root directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dal.database import Base, engine, SessionLocal
+from dal.database import Base, SessionLocal
 from dal.models import Administrator, Applicant, HouseholdMember, Scheme, Application, SystemConfiguration
 from dal.crud_operations import CRUDOperations
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 from bl.services.applicant_service import ApplicantService
 from bl.services.administrator_service import AdministratorService
-from random import randint
+from random import Random
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from environs import Env
@@ -37,19 +38,14 @@ try:
 except:
     PROVISION_DUMMY_APPLICANTS = True # Default to True if not set
 
-connection = engine.connect()
-session = SessionLocal(bind=connection)
-crud_operations = CRUDOperations(session)
 
-# Get the system administrator for creating applicants
-creator = AdministratorService(crud_operations).get_administrator_by_username(ADMIN_USER_NAME)
-
-def setup_applicants(applicant_service: ApplicantService, creator, totalcount) -> List[int]:
+def setup_applicants(applicant_service: ApplicantService, creator, totalcount, seed: Optional[int] = None) -> List[int]:
     """
     Create 20 diverse applicants with household members for testing.
     
     Args:
         applicant_service (ApplicantService): An instance of the ApplicantService.
+        seed (Optional[int]): Seed of the random ages and durations, to generate the same profiles again. Random if None.
 
     Returns:
         List[int]: A list of created applicant IDs for further use in tests.
@@ -57,6 +53,10 @@ def setup_applicants(applicant_service: ApplicantService, creator, totalcount) -
     applicants_data = []
     household_data = []
     
+    # Every date is computed from one reference time, so that all the applicants of a run are generated as of the same moment
+    now = datetime.now()
+    day = timedelta(days=1)
+    randint = Random(seed).randint  # A private generator: reproducible with a seed, and bound once for the loop
     
     # Create diverse applicants
     for i in range(totalcount):
@@ -65,15 +65,15 @@ def setup_applicants(applicant_service: ApplicantService, creator, totalcount) -
         applicant_data = {
             "name": f"Applicant {uuid4()}",
             "employment_status": "employed" if i % 2 == 0 else "unemployed", # Half employed, half unemployed
-            "employment_status_change_date": datetime.now() - timedelta(days=30 * randint(3, 7)),  # Employed/Unemployed for 3 to 7 months
+            "employment_status_change_date": now - day * (30 * randint(3, 7)),  # Employed/Unemployed for 3 to 7 months
             "sex": "M" if i % 2 == 0 else "F", # Half Male, Half Female
-            "date_of_birth": datetime.now() - timedelta(days=365 * randint(35, 80)),  # Ages between 35 to 80 yo
+            "date_of_birth": now - day * (365 * randint(35, 80)),  # Ages between 35 to 80 yo
             "marital_status": marrital_status,
             "created_by_admin_id": creator.id,
         }
         
         if (marrital_status == "married"):
-            applicant_data["marriage_date"] =  datetime.now() - timedelta(days=30 * randint(3, 20)) # married for 3 to 20 months
+            applicant_data["marriage_date"] =  now - day * (30 * randint(3, 20)) # married for 3 to 20 months
 
         # Create household members for each applicant
         household_members_data = []
@@ -81,7 +81,7 @@ def setup_applicants(applicant_service: ApplicantService, creator, totalcount) -
             household_members_data.append({
                 "name": f"Child {uuid4()}",
                 "relation": "child",
-                "date_of_birth": datetime.now() - timedelta(days=365 * randint(5, 19)),  # Ages between 5 to 19 yo
+                "date_of_birth": now - day * (365 * randint(5, 19)),  # Ages between 5 to 19 yo
                 "employment_status": "unemployed",
                 "sex": "F" if i % 2 == 0 else "M"
             })
@@ -89,7 +89,7 @@ def setup_applicants(applicant_service: ApplicantService, creator, totalcount) -
             household_members_data.append({
                 "name": f"Child {uuid4()}",
                 "relation": "child",
-                "date_of_birth": datetime.now() - timedelta(days=365 * randint(5, 19)),  # Ages between 5 to 19 yo
+                "date_of_birth": now - day * (365 * randint(5, 19)),  # Ages between 5 to 19 yo
                 "employment_status": "unemployed",
                 "sex": "F" if i % 2 == 0 else "M"
             })
@@ -97,7 +97,7 @@ def setup_applicants(applicant_service: ApplicantService, creator, totalcount) -
             household_members_data.append({
                 "name": f"Spouse {uuid4()}",
                 "relation": "spouse",
-                "date_of_birth": datetime.now() - timedelta(days=365 * randint(35, 80)),  # Ages between 35 to 80 yo (similar to applicant)
+                "date_of_birth": now - day * (365 * randint(35, 80)),  # Ages between 35 to 80 yo (similar to applicant)
                 "employment_status": "employed",
                 "sex": "F" if i % 2 != 0 else "M" # Opposite Sex as Applicant
             })
@@ -105,7 +105,7 @@ def setup_applicants(applicant_service: ApplicantService, creator, totalcount) -
             household_members_data.append({
                 "name": f"Parent {uuid4()}",
                 "relation": "parent",
-                "date_of_birth": datetime.now() - timedelta(days=365 * randint(55, 100)),  # Ages between 55 to 100 yo
+                "date_of_birth": now - day * (365 * randint(55, 100)),  # Ages between 55 to 100 yo
                 "employment_status": "unemployed",
                 "sex": "F" if i % 2 == 0 else "M"
             })
@@ -113,12 +113,8 @@ def setup_applicants(applicant_service: ApplicantService, creator, totalcount) -
         applicants_data.append(applicant_data)
         household_data.append(household_members_data)
 
-    # Create applicants and household members using the service
-    created_applicants = []
-    for applicant_data, household_members_data in zip(applicants_data, household_data):
-        created_applicant = applicant_service.create_applicant(applicant_data, household_members_data)
-        created_applicants.append(created_applicant.id)
-        print(f"Applicant [{created_applicant.name}] created.\n")
+    # Create all the applicants and household members using the service, in one transaction
+    return applicant_service.create_applicants(applicants_data, household_data)
 
     
 if __name__ == "__main__":
@@ -127,9 +123,12 @@ if __name__ == "__main__":
         sys.exit(0)
         
     print("Creating Applicant Accounts...\n")
-    AS = ApplicantService(crud_operations)
     i = 20
-    setup_applicants(AS, creator, i)
-    session.close()
-    connection.close()
-    print(f"{i}x Applicant Accounts created successfully.")
\ No newline at end of file
+    started = time.perf_counter()
+    with SessionLocal() as session:
+        crud_operations = CRUDOperations(session)
+        # Get the system administrator for creating applicants
+        creator = AdministratorService(crud_operations).get_administrator_by_username(ADMIN_USER_NAME)
+        created_applicants = setup_applicants(ApplicantService(crud_operations), creator, i)
+    # One summary line rather than a line per applicant
+    print(f"{len(created_applicants)}x Applicant Accounts created successfully in {time.perf_counter() - started:.1f}s.")
\ No newline at end of file
@@ -14,182 +14,170 @@ import os
 # Add the project root directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dal.database import Base, engine, SessionLocal
+from dal.database import SessionLocal
 from dal.crud_operations import CRUDOperations
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List
-from bl.services.administrator_service import AdministratorService
 from bl.services.scheme_service import SchemeService
 
-connection = engine.connect()
-session = SessionLocal(bind=connection)
-crud_operations = CRUDOperations(session)
-scheme_service = SchemeService(crud_operations)
+# All supported schemes are valid from the same date
+VALIDITY_START = datetime(2024, 1, 1)
 
+# The supported schemes, built once at import
+RETRENCHMENT_ASSISTANCE_SCHEME = {
+    "name": "Retrenchment Assistance Scheme",
+    "description": "A scheme to provide financial support and benefits to individuals who have recently been retrenched from their jobs and are newly married.",
+    "eligibility_criteria": {
+        "employment_status": "unemployed",
+        "retrechment_period_months": 6,
+        "marital_status": "married",
+        "marriage_duration_months": 12
+    },
+    "benefits": {
+        "cash_assistance": {
+        "disbursment_amount": 1000,
+        "disbursment_frequency": "One-Off",
+        "disbursment_duration_months": None,
+        "description": "Cash assistance provided to all eligible applicants."
+        },
+        "school_meal_vouchers": {
+        "amount_per_child": 100,
+        "disbursment_frequency": "Monthly",
+        "disbursment_duration_months": 12,
+        "description": "Meal vouchers provided for each child in the household within the primary school age range (6-11 years old).",
+        "eligibility": {
+            "relation": "child",
+            "age_range": {
+            "min": 6,
+            "max": 11
+            }
+        }
+        },
+        "extra_cdc_vouchers": {
+        "amount_per_parent": 200,
+        "disbursment_frequency": "One-Off",
+        "disbursment_duration_months": None,
+        "description": "Extra CDC vouchers provided for each elderly parent above the age of 65.",
+        "eligibility": {
+            "relation": "parent",
+            "age_threshold": 65
+        }
+        }
+    },
+    "validity_start_date": VALIDITY_START,
+    "validity_end_date": None
+}
 
-def retrenchment_assistance_scheme(scheme_service):
-    list_of_schemes, count = scheme_service.get_schemes_by_filters(filters={"name": "Retrenchment Assistance Scheme"}, fetch_valid_schemes=False)
-    if count == 0:
-        # Retrenchment Assistance Scheme
-        scheme_data = {
-            "name": "Retrenchment Assistance Scheme",
-            "description": "A scheme to provide financial support and benefits to individuals who have recently been retrenched from their jobs and are newly married.",
-            "eligibility_criteria": {
-                "employment_status": "unemployed",
-                "retrechment_period_months": 6,
-                "marital_status": "married",
-                "marriage_duration_months": 12
-            },
-            "benefits": {
-                "cash_assistance": {
-                "disbursment_amount": 1000,
-                "disbursment_frequency": "One-Off",
-                "disbursment_duration_months": None,
-                "description": "Cash assistance provided to all eligible applicants."
-                },
-                "school_meal_vouchers": {
-                "amount_per_child": 100,
-                "disbursment_frequency": "Monthly",
-                "disbursment_duration_months": 12,
-                "description": "Meal vouchers provided for each child in the household within the primary school age range (6-11 years old).",
-                "eligibility": {
-                    "relation": "child",
-                    "age_range": {
-                    "min": 6,
-                    "max": 11
-                    }
-                }
-                },
-                "extra_cdc_vouchers": {
-                "amount_per_parent": 200,
-                "disbursment_frequency": "One-Off",
-                "disbursment_duration_months": None,
-                "description": "Extra CDC vouchers provided for each elderly parent above the age of 65.",
-                "eligibility": {
-                    "relation": "parent",
-                    "age_threshold": 65
-                }
-                }
-            },
-            "validity_start_date": datetime(2024, 1, 1),
-            "validity_end_date": None
+MIDDLEAGED_RESKILLING_ASSISTANCE_SCHEME = {
+    "name": "Middle-aged Reskilling Assistance Scheme",
+    "description": "A scheme to provide financial support and benefits to individuals aged 40 and above who are unemployed, encouraging reskilling and upskilling.",
+    "eligibility_criteria": {
+        "age_threshold": 40,
+        "employment_status": "unemployed"
+    },
+    "benefits": {
+        "skillsfuture_credit_top_up": {
+            "disbursment_amount": 1000,
+            "disbursment_frequency": "One-Off",
+            "disbursment_duration_months": None,
+            "description": "One-time Skillsfuture Credit top-up of $1000."
+        },
+        "study_allowance": {
+            "disbursment_amount": 2000,
+            "disbursment_frequency": "Monthly",
+            "disbursment_duration_months": 6,
+            "description": "Monthly study allowance of $2000 for up to 6 months."
         }
-        scheme_service.create_scheme(scheme_data)
-        print("Retrenchment Assistance Scheme created.\n")
-    else:
-        print("Retrenchment Assistance Scheme already exists.\n")
-    
-    
-def middleaged_reskilling_assistance_scheme(scheme_service):
-    # Middle-aged Reskilling Assistance Scheme
-    list_of_schemes, count = scheme_service.get_schemes_by_filters(filters={"name": "Middle-aged Reskilling Assistance Scheme"}, fetch_valid_schemes=False)
-    if count == 0:
-        middleaged_reskilling_assistance_scheme_data = {
-            "name": "Middle-aged Reskilling Assistance Scheme",
-            "description": "A scheme to provide financial support and benefits to individuals aged 40 and above who are unemployed, encouraging reskilling and upskilling.",
-            "eligibility_criteria": {
-                "age_threshold": 40,
-                "employment_status": "unemployed"
-            },
-            "benefits": {
-                "skillsfuture_credit_top_up": {
-                    "disbursment_amount": 1000,
-                    "disbursment_frequency": "One-Off",
-                    "disbursment_duration_months": None,
-                    "description": "One-time Skillsfuture Credit top-up of $1000."
-                },
-                "study_allowance": {
-                    "disbursment_amount": 2000,
-                    "disbursment_frequency": "Monthly",
-                    "disbursment_duration_months": 6,
-                    "description": "Monthly study allowance of $2000 for up to 6 months."
-                }
-            },
-            "validity_start_date": datetime(2024, 1, 1),
-            "validity_end_date": None
+    },
+    "validity_start_date": VALIDITY_START,
+    "validity_end_date": None
+}
+
+SENIOR_CITIZEN_ASSISTANCE_SCHEME = {
+    "name": "Senior Citizen Assistance Scheme",
+    "description": "A scheme to provide financial support and benefits to individuals aged 65 and above.",
+    "eligibility_criteria": {
+        "age_threshold": 65
+    },
+    "benefits": {
+        "cpf_top_up": {
+            "disbursment_amount": 200,
+            "disbursment_frequency": "One-Off",
+            "disbursment_duration_months": None,
+            "description": "One-time CPF top-up of $200."
+        },
+        "cdc_voucher": {
+            "disbursment_amount": 200,
+            "disbursment_frequency": "One-Off",
+            "disbursment_duration_months": None,
+            "description": "One-time CDC voucher of $200."
         }
-        scheme_service.create_scheme(middleaged_reskilling_assistance_scheme_data)
-        print("Middle-aged Reskilling Assistance Scheme created.\n")
-    else:
-        print("Middle-aged Reskilling Assistance Scheme already exists.\n")
-    
-def senior_citizen_assistance_scheme(scheme_service):
-    # Retrenchment Assistance Scheme
-    list_of_schemes, count = scheme_service.get_schemes_by_filters(filters={"name": "Senior Citizen Assistance Scheme"}, fetch_valid_schemes=False)
-    if count == 0:
-        senior_citizen_assistance_scheme_data = {
-            "name": "Senior Citizen Assistance Scheme",
-            "description": "A scheme to provide financial support and benefits to individuals aged 65 and above.",
-            "eligibility_criteria": {
-                "age_threshold": 65
-            },
-            "benefits": {
-                "cpf_top_up": {
-                    "disbursment_amount": 200,
-                    "disbursment_frequency": "One-Off",
-                    "disbursment_duration_months": None,
-                    "description": "One-time CPF top-up of $200."
-                },
-                "cdc_voucher": {
-                    "disbursment_amount": 200,
-                    "disbursment_frequency": "One-Off",
-                    "disbursment_duration_months": None,
-                    "description": "One-time CDC voucher of $200."
-                }
-            },
-            "validity_start_date": datetime(2024, 1, 1),
-            "validity_end_date": None
+    },
+    "validity_start_date": VALIDITY_START,
+    "validity_end_date": None
+}
+
+SINGLE_WORKING_MOTHERS_SUPPORT_SCHEME = {
+    "name": "Single Working Mothers Support Scheme",
+    "description": "A scheme to provide financial support and benefits to single working mothers with young children (18 and below).",
+    "eligibility_criteria": {
+        "sex": "F",
+        "marital_status": ['single', 'divorced', 'widowed'],
+        "employment_status": "employed",
+        "household_composition": {
+            "relation": "child",
+            "age_range": {
+                "age_threshold": 18
+            }
         }
-        scheme_service.create_scheme(senior_citizen_assistance_scheme_data)
-        print("Senior Citizen Assistance Scheme created.\n")
-    else:
-        print("Senior Citizen Assistance Scheme already exists.\n")
-    
-def single_working_mothers_support_scheme(scheme_service):
-    list_of_schemes, count = scheme_service.get_schemes_by_filters(filters={"name": "Single Working Mothers Support Scheme"}, fetch_valid_schemes=False)
-    if count == 0:       
-        single_working_mothers_support_scheme = {
-            "name": "Single Working Mothers Support Scheme",
-            "description": "A scheme to provide financial support and benefits to single working mothers with young children (18 and below).",
-            "eligibility_criteria": {
-                "sex": "F",
-                "marital_status": ['single', 'divorced', 'widowed'],
-                "employment_status": "employed",
-                "household_composition": {
-                    "relation": "child",
-                    "age_range": {
-                        "age_threshold": 18
-                    }
-                }
-            },
-            "benefits": {
-                "cash_assistance": {
-                    "disbursment_amount": 1000,
-                    "disbursment_frequency": "One-Off",
-                    "disbursment_duration_months": None,
-                    "description": "Cash assistance provided to all eligible applicants."
-                },
-                "income_tax_rebates": {
-                    "disbursment_amount": 1000,
-                    "disbursment_frequency": "annually",
-                    "disbursment_duration_months": 60,
-                    "description": "Income Tax Rebates given to all eligible applicants for every eligible children in the household."
-                }
-            },
-            "validity_start_date": datetime(2024, 1, 1),
-            "validity_end_date": None
+    },
+    "benefits": {
+        "cash_assistance": {
+            "disbursment_amount": 1000,
+            "disbursment_frequency": "One-Off",
+            "disbursment_duration_months": None,
+            "description": "Cash assistance provided to all eligible applicants."
+        },
+        "income_tax_rebates": {
+            "disbursment_amount": 1000,
+            "disbursment_frequency": "annually",
+            "disbursment_duration_months": 60,
+            "description": "Income Tax Rebates given to all eligible applicants for every eligible children in the household."
         }
-        scheme_service.create_scheme(single_working_mothers_support_scheme)
-        print("Single Working Mothers Support Scheme created.\n")
-    else:
-        print("Single Working Mothers Support Scheme already exists.\n")
+    },
+    "validity_start_date": VALIDITY_START,
+    "validity_end_date": None
+}
+
+SUPPORTED_SCHEMES = [
+    RETRENCHMENT_ASSISTANCE_SCHEME,
+    MIDDLEAGED_RESKILLING_ASSISTANCE_SCHEME,
+    SENIOR_CITIZEN_ASSISTANCE_SCHEME,
+    SINGLE_WORKING_MOTHERS_SUPPORT_SCHEME,
+]
+
+
+def provision_supported_schemes(scheme_service: SchemeService) -> List[str]:
+    """
+    Create the supported schemes that do not exist yet, in one bulk insert and one commit.
+
+    Args:
+        scheme_service (SchemeService): An instance of the SchemeService.
+
+    Returns:
+        List[str]: The names of the schemes created.
+    """
+    # Look up which supported schemes already exist with a single query, rather than one query per scheme
+    existing_names = scheme_service.get_existing_scheme_names([scheme["name"] for scheme in SUPPORTED_SCHEMES])
+    missing_schemes = [scheme for scheme in SUPPORTED_SCHEMES if scheme["name"] not in existing_names]
+    if missing_schemes:
+        scheme_service.create_schemes(missing_schemes)
+    for scheme in SUPPORTED_SCHEMES:
+        print(f"{scheme['name']} {'already exists' if scheme['name'] in existing_names else 'created'}.\n")
+    return [scheme["name"] for scheme in missing_schemes]
     
 if __name__ == "__main__":
     print("Creating Supported Schemes...\n")
     
-    retrenchment_assistance_scheme(scheme_service)
-    middleaged_reskilling_assistance_scheme(scheme_service)
-    senior_citizen_assistance_scheme(scheme_service)
-    single_working_mothers_support_scheme(scheme_service)
-    session.close()
-    connection.close()
+    with SessionLocal() as session:
+        provision_supported_schemes(SchemeService(CRUDOperations(session)))
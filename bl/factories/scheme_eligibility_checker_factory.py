@@ -8,10 +8,10 @@ Design Pattern:
 - The SchemeEligibilityCheckerFactory class implements the Factory Method pattern to create SchemeEligibilityChecker objects based on the type of scheme. This approach allows for flexible instantiation of eligibility checkers for different schemes.
 
 2. Dependency Injection:
-- The class takes a database session as a dependency, enabling it to interact with the database to retrieve scheme information.
+- The class optionally takes a database session as a dependency. The current strategies need no database access, so a single factory instance can be shared across requests.
 
-3. Use of Lambdas for Instantiation:
-- The use of lambdas in the eligibility_definitions_mapping dictionary allows for flexible instantiation of eligibility strategies based on the scheme type. This approach ensures that the correct eligibility strategy is used for each scheme.
+3. Class-level Strategy Registry:
+- The eligibility_definitions_mapping dictionary maps each scheme name to its eligibility strategy class. It is built once with the class, and the strategy is instantiated with the scheme on lookup. This approach ensures that the correct eligibility strategy is used for each scheme.
 
 4. Type Annotations:
 - The use of type annotations for method arguments and return types enhances code readability and type safety.
@@ -30,7 +30,7 @@ Design Pattern:
 """
 # scheme_eligibility_checker_factory.py
 
-from typing import Dict, Optional, Callable
+from typing import Dict, Optional, Type
 from sqlalchemy.orm import Session
 from dal.models import Scheme
 from bl.schemes.base_eligibility import BaseEligibility
@@ -48,7 +48,17 @@ class SchemeEligibilityCheckerFactory(BaseSchemeEligibilityCheckerFactory):
     Factory class to create SchemeEligibilityChecker objects,
     which pair a Scheme with its corresponding Eligibility definitions.
     """
-    def __init__(self, db_session: Session):
+    # Eligibility strategy of each scheme, keyed by scheme name. Built once at class creation rather than on every lookup.
+    # More schemes and their strategies can be added here
+    eligibility_definitions_mapping: Dict[str, Type[BaseEligibility]] = {
+        "Retrenchment Assistance Scheme": RetrenchmentAssistanceEligibility,
+        "Senior Citizen Assistance Scheme": SeniorCitizenAssistanceEligibility,
+        "Middle-aged Reskilling Assistance Scheme": MiddleagedReskillingAssistanceEligibility,
+        "Single Working Mothers Support Scheme": SingleWorkingMothersSupportEligibility,
+    }
+
+    def __init__(self, db_session: Optional[Session] = None):
+        # The factory keeps no request state, so one instance can be shared across requests and sessions
         self.db_session = db_session
     
     def load_scheme_eligibility_checker(self, scheme: Scheme) -> SchemeEligibilityChecker:
@@ -82,21 +92,11 @@ class SchemeEligibilityCheckerFactory(BaseSchemeEligibilityCheckerFactory):
             Default Handling: The use of a DefaultEligibility class is a clean and effective way to handle schemes without specific eligibility configurations. This avoids the need for null checks or special handling in other parts of the code and simplifies the overall logic.
 
         """
-        # Use lambdas to handle instantiation logic for each strategy
-        # Use of Lambdas for Consistency: Lambdas ensure all values in eligibility_definitions_mapping are callable, maintaining type consistency and allowing for more flexible initialization logic.
-        eligibility_definitions_mapping: Dict[str, Callable[[], BaseEligibility]] = {
-            "Retrenchment Assistance Scheme": lambda: RetrenchmentAssistanceEligibility(scheme),
-            "Senior Citizen Assistance Scheme": lambda: SeniorCitizenAssistanceEligibility(scheme),
-            "Middle-aged Reskilling Assistance Scheme": lambda: MiddleagedReskillingAssistanceEligibility(scheme),
-            "Single Working Mothers Support Scheme": lambda: SingleWorkingMothersSupportEligibility(scheme),
-            # More schemes and their strategies can be added here
-        }
-
-        # Retrieve the factory function for the scheme's eligibility strategy
-        eligibility_definition_factory = eligibility_definitions_mapping.get(scheme.name)
-
-        if not eligibility_definition_factory:
+        # Retrieve the eligibility strategy class for the scheme
+        eligibility_definition_class = self.eligibility_definitions_mapping.get(scheme.name)
+
+        if not eligibility_definition_class:
             return DefaultEligibility()
 
-        # Call the factory function to instantiate the eligibility strategy
-        return eligibility_definition_factory()
\ No newline at end of file
+        # Instantiate the eligibility strategy for the scheme
+        return eligibility_definition_class(scheme)
@@ -45,6 +45,7 @@ from bl.schemes.base_eligibility import BaseEligibility
 from dal.crud_operations import CRUDOperations
 from bl.factories.scheme_eligibility_checker_factory import SchemeEligibilityCheckerFactory
 from bl.factories.base_scheme_eligibility_checker_factory import BaseSchemeEligibilityCheckerFactory
+from bl.schemes.scheme_eligibilty_checker import SchemeEligibilityChecker
 
 """
 Design Pattern: 
@@ -104,6 +105,19 @@ class SchemesManager:
         Check which schemes an applicant is eligible for using various eligibility strategies.
         """
         schemes, total_Schemes = self.__crud_operations.get_schemes_by_filters(schemes_filters, fetch_valid_schemes)
+        return self.check_eligibility_against_schemes(schemes, applicant)
+
+    def check_eligibility_against_schemes(self, schemes: List[Scheme], applicant: Applicant) -> tuple[List[EligibilityResult], List[Scheme]]:
+        """
+        Check which of the given (already loaded) schemes an applicant is eligible for. No query is run.
+
+        Args:
+            schemes (List[Scheme]): The schemes to check the applicant against.
+            applicant (Applicant): The applicant, with their household members loaded.
+
+        Returns:
+            tuple[List[EligibilityResult], List[Scheme]]: The eligibility result of every scheme, and the schemes the applicant is eligible for.
+        """
         eligibility_results = []
         eligible_schemes = []
 
@@ -120,6 +134,26 @@ class SchemesManager:
         Check if an applicant is eligible for a specific scheme.
         """
         scheme_eligibility_checker = self.__schemeFactory.load_scheme_eligibility_checker(scheme)
+        return self.__check_eligibility(scheme, scheme_eligibility_checker, applicant)
+
+    def check_scheme_eligibility_for_applicants(self, scheme: Scheme, applicants: List[Applicant]) -> List[EligibilityResult]:
+        """
+        Check which of several applicants are eligible for a specific scheme. The scheme's eligibility checker is loaded once for all of them.
+
+        Args:
+            scheme (Scheme): The scheme to check the applicants against.
+            applicants (List[Applicant]): The applicants, with their household members loaded.
+
+        Returns:
+            List[EligibilityResult]: The eligibility result of every applicant, in the order of applicants.
+        """
+        scheme_eligibility_checker = self.__schemeFactory.load_scheme_eligibility_checker(scheme)
+        return [self.__check_eligibility(scheme, scheme_eligibility_checker, applicant) for applicant in applicants]
+
+    def __check_eligibility(self, scheme: Scheme, scheme_eligibility_checker: SchemeEligibilityChecker, applicant: Applicant) -> EligibilityResult:
+        """
+        Check an applicant against a scheme with the scheme's (already loaded) eligibility checker.
+        """
         is_eligible, message = scheme_eligibility_checker._check_eligibility(applicant)
         eligible_benefits = scheme_eligibility_checker._calculate_benefits(applicant) if is_eligible else []
         return EligibilityResult(
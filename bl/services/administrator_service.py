@@ -138,12 +138,13 @@ class AdministratorService:
         if admin: 
             if not admin.account_locked:
                 if self.__verify_password(admin.password_hash, password, admin.salt):
-                    # Reset login failure counters on successful login
-                    self.__reset_login_failure_counters(admin.id)
+                    # Reset login failure counters on successful login. Most logins have none to reset, so the UPDATE and its commit are skipped
+                    if admin.consecutive_failed_logins or admin.failed_login_starttime is not None:
+                        self.__reset_login_failure_counters(admin.id)
                     return admin, f"Welcome [{admin.username}]!"
                 else:
                     # Increment login failure counters
-                    consecutive_failed_logins = self.__increment_login_failure_counter(admin.id)
+                    consecutive_failed_logins = self.__increment_login_failure_counter(admin)
                     mesg = f"Invalid password. {self.MAX_PASSWORD_RETRIES - consecutive_failed_logins} attempts remaining."
             else:
                 mesg = "Account is locked. Please contact the administrator."
@@ -151,12 +152,13 @@ class AdministratorService:
             mesg = "Invalid username. Please try again."
         return None, mesg
     
-    def __increment_login_failure_counter(self, admin_id: int) -> int:
+    def __increment_login_failure_counter(self, admin: Administrator) -> int:
         """
         Increment the consecutive_failed_logins counter and set failed_login_starttime.
         Lock the account if necessary, considering the retry time window.
+        Takes the administrator already loaded by verify_login_credentials rather than fetching it again.
         """
-        admin = self.__get_admin_by_id(admin_id) # Check if the admin exists. Raises an exception if not found.
+        admin_id = admin.id
         current_time = datetime.now(timezone.utc)  # Use timezone-aware datetime
         current_count = admin.consecutive_failed_logins
         time_window = timedelta(minutes=self.PASSWORD_RETRIES_TIME_WINDOW_MINUTES)  # Configure this as needed
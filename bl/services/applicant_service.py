@@ -36,7 +36,7 @@ from dal.crud_operations import CRUDOperations
 from sqlalchemy.orm import Session
 from dal.models import Applicant, HouseholdMember
 from exceptions import ApplicantNotFoundException, InvalidApplicantDataException, HouseholdMemberNotFoundException, InvalidHouseholdMemberDataException, InvalidPaginationParameterException, InvalidSortingParameterException
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterator
 from bl.services.scheme_service import SchemeService
 from utils.data_validation import validate_applicant_data, validate_household_member_data
 from sqlalchemy import asc, desc
@@ -70,6 +70,49 @@ class ApplicantService:
         """
         return self.crud_operations.get_all_applicants(page, page_size, sort_by, sort_order, filters)
 
+    def iter_applicants_with_household(self, batch_size: int = 500) -> Iterator[List[Applicant]]:
+        """
+        Iterate over every applicant with their household members in batches of batch_size, for batch jobs that process all the 
+        applicants in bounded memory. Each batch takes two queries; unlike get_all_applicants, there is no total count.
+
+        Yields:
+            List[Applicant]: The next batch of applicants, ordered by ID.
+        """
+        return self.crud_operations.iter_applicants_with_household(batch_size)
+
+    def get_all_applicants_rows(self, 
+                        page: int = 1, 
+                        page_size: int = 100, 
+                        sort_by: Optional[str] = 'name', 
+                        sort_order: Optional[str] = 'asc', 
+                        filters: Optional[Dict[str, any]] = None) -> Tuple[List[Dict], int]:
+        """
+        Retrieve a page of applicants as plain dictionaries (with their household members) for read-only listings.
+
+        Args:
+            page (int): The page number to retrieve.
+            page_size (int): The number of applicants to retrieve per page.
+            sort_by (Optional[str]): The field to sort by ('name' or 'created_at').
+            sort_order (Optional[str]): The sort order ('asc' or 'desc').
+            filters (Optional[Dict[str, any]]): A dictionary of filters to apply to the query.
+
+        Returns:
+            Tuple[List[Dict], int]: A tuple containing the applicant rows for the specified page and the total count of applicants.
+        """
+        return self.crud_operations.get_applicants_rows_by_filters(page, page_size, sort_by, sort_order, filters)
+
+    def get_applicants_version(self, filters: Optional[Dict[str, any]] = None) -> Tuple:
+        """
+        Retrieve a fingerprint of the applicants matching the filters. It changes whenever a matching applicant or household member changes.
+
+        Args:
+            filters (Optional[Dict[str, any]]): A dictionary of filters to apply to the query.
+
+        Returns:
+            Tuple: The aggregate values identifying the current state of the matching applicants.
+        """
+        return self.crud_operations.get_applicants_version(filters)
+
     def get_applicant_by_id(self, applicant_id: int) -> Applicant:
         """
         Retrieve an applicant by ID.
@@ -95,6 +138,47 @@ class ApplicantService:
         
         
         # Phase 1: Validate all data
+        self.__validate_new_applicant(applicant_data, household_members_data)
+
+        # Phase 2: Delegate to CRUDOperations for record creation
+        try:
+            # Use the enhanced CRUDOperations method to create the applicant and household members
+            applicant = self.crud_operations.create_applicant(applicant_data, household_members_data)
+        except Exception as e:
+            # Log the exception or handle it as needed
+            raise e
+
+        return applicant
+
+
+    def create_applicants(self, applicants_data: List[dict], household_members_data: List[List[dict]]) -> List[int]:
+        """
+        Create several applicants and their household members in a single transaction, e.g. for batch provisioning.
+        Every applicant is validated as create_applicant does before anything is written. The rows are bulk inserted without 
+        building ORM objects, so only the new IDs are returned; use create_applicant where the created applicant is needed.
+
+        Args:
+            applicants_data (List[dict]): Data for creating each applicant.
+            household_members_data (List[List[dict]]): The household members' data of each applicant, in the same order.
+
+        Returns:
+            List[int]: The IDs of the created applicants, in the order of applicants_data.
+        """
+        # Phase 1: Validate all data
+        for applicant_data, members_data in zip(applicants_data, household_members_data):
+            self.__validate_new_applicant(applicant_data, members_data)
+
+        # Phase 2: Delegate to CRUDOperations for record creation
+        return self.crud_operations.create_applicants(applicants_data, household_members_data)
+
+    def __validate_new_applicant(self, applicant_data: dict, household_members_data: List[dict]) -> None:
+        """
+        Validate the data of a new applicant and their household members.
+
+        Raises:
+            InvalidApplicantDataException: If the applicant data is invalid.
+            InvalidHouseholdMemberDataException: If a household member's data is invalid, or there are more than two parents.
+        """
         isApplicantDataValid, msg = validate_applicant_data(applicant_data, for_create_mode=True)
         if not isApplicantDataValid:
             raise InvalidApplicantDataException(msg)
@@ -110,17 +194,6 @@ class ApplicantService:
         if parents_count > 2:
             raise InvalidHouseholdMemberDataException("An applicant cannot have more than two parents.")
 
-        # Phase 2: Delegate to CRUDOperations for record creation
-        try:
-            # Use the enhanced CRUDOperations method to create the applicant and household members
-            applicant = self.crud_operations.create_applicant(applicant_data, household_members_data)
-        except Exception as e:
-            # Log the exception or handle it as needed
-            raise e
-
-        return applicant
-
-
     def update_applicant(self, applicant_id: int, update_data: dict) -> Applicant:
         """
         Update an applicant's details.
@@ -31,9 +31,9 @@ Design Patterns:
 """
 # application_service.py
 
-from typing import List, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterator, Callable
 from dal.crud_operations import CRUDOperations
-from dal.models import Application, Scheme
+from dal.models import Applicant, Application, Scheme
 from exceptions import ApplicationNotFoundException, ApplicantNotFoundException, SchemeNotFoundException, InvalidApplicationDataException, AdministratorNotFoundException, InvalidPaginationParameterException, InvalidSortingParameterException
 from bl.factories.base_scheme_eligibility_checker_factory import BaseSchemeEligibilityCheckerFactory
 from bl.schemes.schemes_manager import SchemesManager
@@ -56,6 +56,31 @@ class ApplicationService:
 
         return self.crud_operations.get_all_applications(page, page_size, sort_by, sort_order)
 
+    def iter_all_applications(self, 
+                            page: int = 1, 
+                            page_size: int = 100, 
+                            sort_by: Optional[str] = 'created_at', 
+                            sort_order: Optional[str] = 'asc') -> Tuple[Iterator[Tuple[Application, int]], Callable[[], int]]:
+        """
+        Retrieve a page of applications as rows fetched in batches while they are consumed, for streamed responses.
+        """
+        return self.crud_operations.iter_all_applications(page, page_size, sort_by, sort_order)
+
+    def get_applications_by_cursor(self, 
+                            cursor: Optional[int] = None, 
+                            limit: int = 10, 
+                            sort_order: Optional[str] = 'asc') -> Tuple[List[Application], Optional[int]]:
+        """
+        Retrieve a keyset-paginated page of applications ordered by creation time, without a total count.
+        """
+        return self.crud_operations.get_applications_by_cursor(cursor, limit, sort_order)
+
+    def get_applications_version(self) -> Tuple:
+        """
+        Retrieve a fingerprint of the applications listing. It changes whenever an application or an applicant, household member or scheme it embeds changes.
+        """
+        return self.crud_operations.get_applications_version()
+
     def get_application_by_id(self, application_id: int) -> Application:
         """
         Retrieve an application by ID.
@@ -127,6 +152,126 @@ class ApplicationService:
         
         return self.crud_operations.create_application(application_data)
 
+    def create_applications_for_schemes(self, applicant_id: int, schemes: List[Scheme], created_by_admin_id: int, schemeEligibilityCheckerFactory: BaseSchemeEligibilityCheckerFactory) -> Tuple[List[Application], Dict[int, str]]:
+        """
+        Create an application of one applicant for each of several schemes, in a single transaction.
+        This is the batch counterpart of create_application: the applicant and administrator are retrieved once, the approved applications 
+        of the applicant are checked with one query, eligibility is evaluated in memory for every scheme, and all the applications are 
+        inserted with one commit (see create_applications_for_applicants).
+
+        Args:
+            applicant_id (int): The ID of the applicant.
+            schemes (List[Scheme]): The schemes to apply for.
+            created_by_admin_id (int): The ID of the administrator creating the applications.
+            schemeEligibilityCheckerFactory (BaseSchemeEligibilityCheckerFactory): The factory of the schemes' eligibility checkers.
+
+        Returns:
+            Tuple[List[Application], Dict[int, str]]: The created applications, and the reason each scheme that was skipped 
+            (already approved, or invalid application data) was skipped, keyed by scheme ID.
+        """
+        applicant = self.crud_operations.get_applicant(applicant_id)
+        if not applicant:
+            raise ApplicantNotFoundException(f"Applicant with ID {applicant_id if applicant_id else 'null'} not found.")
+
+        applications, skipped = self.create_applications_for_applicants([applicant], schemes, created_by_admin_id, schemeEligibilityCheckerFactory)
+        return applications, {scheme_id: reason for (_, scheme_id), reason in skipped.items()}
+
+    def create_applications_for_applicants(self, applicants: List[Applicant], schemes: List[Scheme], created_by_admin_id: int, schemeEligibilityCheckerFactory: BaseSchemeEligibilityCheckerFactory) -> Tuple[List[Application], Dict[Tuple[int, int], str]]:
+        """
+        Create an application of each of several (already loaded) applicants for each of several schemes, in a single transaction.
+        This is the batch job counterpart of create_applications_for_schemes: the approved applications of all the applicants are 
+        checked with one query, eligibility is evaluated in memory one scheme at a time over all the applicants, and all the 
+        applications are inserted with one commit.
+
+        Args:
+            applicants (List[Applicant]): The applicants, with their household members loaded.
+            schemes (List[Scheme]): The schemes to apply for.
+            created_by_admin_id (int): The ID of the administrator creating the applications.
+            schemeEligibilityCheckerFactory (BaseSchemeEligibilityCheckerFactory): The factory of the schemes' eligibility checkers.
+
+        Returns:
+            Tuple[List[Application], Dict[Tuple[int, int], str]]: The created applications, and the reason each (applicant ID, scheme ID) 
+            pair that was skipped (already approved, or invalid application data) was skipped.
+        """
+        return self.__create_applications([(scheme, applicants) for scheme in schemes], created_by_admin_id, schemeEligibilityCheckerFactory)
+
+    def create_applications_for_pairs(self, pairs: List[Tuple[int, int]], created_by_admin_id: int, schemeEligibilityCheckerFactory: BaseSchemeEligibilityCheckerFactory) -> Tuple[List[Application], Dict[Tuple[int, int], str]]:
+        """
+        Create an application for each of several (applicant ID, scheme ID) pairs, in a single transaction.
+        This is the bulk counterpart of create_application: the applicants and schemes are retrieved with one query each, and the 
+        pairs are then processed as create_applications_for_applicants does.
+
+        Args:
+            pairs (List[Tuple[int, int]]): The (applicant ID, scheme ID) pairs to create applications for.
+            created_by_admin_id (int): The ID of the administrator creating the applications.
+            schemeEligibilityCheckerFactory (BaseSchemeEligibilityCheckerFactory): The factory of the schemes' eligibility checkers.
+
+        Returns:
+            Tuple[List[Application], Dict[Tuple[int, int], str]]: The created applications, and the reason each (applicant ID, scheme ID) 
+            pair that was skipped (already approved, or invalid application data) was skipped.
+
+        Raises:
+            ApplicantNotFoundException: If a pair refers to an applicant that does not exist. Nothing is created.
+            SchemeNotFoundException: If a pair refers to a scheme that does not exist. Nothing is created.
+        """
+        applicants = {applicant.id: applicant for applicant in self.crud_operations.get_applicants_by_ids(list({applicant_id for applicant_id, _ in pairs}))}
+        schemes = {scheme.id: scheme for scheme in self.crud_operations.get_schemes_by_ids(list({scheme_id for _, scheme_id in pairs}))}
+
+        applicants_by_scheme: Dict[int, List[Applicant]] = {}
+        for applicant_id, scheme_id in pairs:
+            if applicant_id not in applicants:
+                raise ApplicantNotFoundException(f"Applicant with ID {applicant_id if applicant_id else 'null'} not found.")
+            if scheme_id not in schemes:
+                raise SchemeNotFoundException(f"Scheme with ID {scheme_id} not found.")
+            applicants_by_scheme.setdefault(scheme_id, []).append(applicants[applicant_id])
+
+        return self.__create_applications([(schemes[scheme_id], scheme_applicants) for scheme_id, scheme_applicants in applicants_by_scheme.items()], 
+                                          created_by_admin_id, schemeEligibilityCheckerFactory)
+
+    def __create_applications(self, applicants_by_scheme: List[Tuple[Scheme, List[Applicant]]], created_by_admin_id: int, schemeEligibilityCheckerFactory: BaseSchemeEligibilityCheckerFactory) -> Tuple[List[Application], Dict[Tuple[int, int], str]]:
+        """
+        Create the applications of the given applicants for each scheme with one commit, checking the approved applications with one query 
+        and loading each scheme's eligibility checker once.
+        """
+        admin = self.crud_operations.get_administrator(created_by_admin_id)
+        if not admin:
+            raise AdministratorNotFoundException(f"Administrator with ID {created_by_admin_id if created_by_admin_id else 'null'} not found.")
+
+        # Same pre-eligibility check as create_application, for all the applicants at once
+        approved_scheme_ids = self.crud_operations.get_approved_scheme_ids_for_applicants(
+            list({applicant.id for _, applicants in applicants_by_scheme for applicant in applicants}))
+
+        scheme_manager = SchemesManager(self.crud_operations, schemeEligibilityCheckerFactory)
+        applications_data = []
+        skipped = {}
+        for scheme, applicants in applicants_by_scheme:
+            candidates = []
+            for applicant in applicants:
+                if scheme.id in approved_scheme_ids.get(applicant.id, ()):
+                    skipped[(applicant.id, scheme.id)] = f"Applicant {applicant.name} has already successfully applied to scheme {scheme.name}."
+                else:
+                    candidates.append(applicant)
+
+            # The scheme's eligibility checker is loaded once and run over all its candidate applicants
+            for applicant, eligibility_results in zip(candidates, scheme_manager.check_scheme_eligibility_for_applicants(scheme, candidates)):
+                application_data = {
+                    "applicant_id": applicant.id,
+                    "scheme_id": scheme.id,
+                    "status": "approved" if eligibility_results.report["is_eligible"] else "rejected",
+                    "eligibility_verdict": eligibility_results.report["eligibility_message"], 
+                    "awarded_benefits": eligibility_results.report["eligible_benefits"],  
+                    "created_by_admin_id": created_by_admin_id
+                }
+                isvalid , msg = validate_application_data(application_data, True)
+                if not isvalid:
+                    skipped[(applicant.id, scheme.id)] = msg
+                    continue
+                applications_data.append(application_data)
+
+        if not applications_data:
+            return [], skipped
+        return self.crud_operations.create_applications(applications_data), skipped
+
     
     def update_application(self, application_id: int, update_data: dict, schemeEligibilityCheckerFactory: BaseSchemeEligibilityCheckerFactory) -> Application:
         """
@@ -7,7 +7,7 @@ from dal.crud_operations import CRUDOperations
 from dal.models import Scheme
 from exceptions import SchemeNotFoundException, InvalidSchemeDataException  
 from utils.data_validation import validate_scheme_data
-from typing import List, Tuple
+from typing import List, Tuple, Set
 """ 
 Summary: The SchemeService class is responsible for handling all business logic related to financial assistance schemes, including CRUD operations and potentially complex logic involving scheme eligibility
 
@@ -55,6 +55,20 @@ class SchemeService:
         scheme = self.crud_operations.create_scheme(scheme_data)
         return scheme
 
+    def create_schemes(self, schemes_data: List[dict]) -> List[int]:
+        """
+        Create several schemes in one transaction, e.g. when provisioning the supported schemes.
+        Every scheme is validated before anything is written.
+
+        Returns:
+            List[int]: The IDs of the created schemes, in the order of schemes_data.
+        """
+        for scheme_data in schemes_data:
+            isvalid , msg = validate_scheme_data(scheme_data, True)
+            if not isvalid:
+                raise InvalidSchemeDataException(msg)
+        return self.crud_operations.create_schemes(schemes_data)
+
     def update_scheme(self, scheme_id: int, update_data: dict) -> Scheme:
         """
         Update a scheme's details.
@@ -75,6 +89,12 @@ class SchemeService:
             raise SchemeNotFoundException(f"Scheme with ID {scheme_id} not found.")
         self.crud_operations.delete_scheme(scheme_id)
 
+    def get_existing_scheme_names(self, names: List[str]) -> Set[str]:
+        """
+        Find which of the given scheme names already exist (whatever their validity dates), with one query.
+        """
+        return self.crud_operations.get_existing_scheme_names(names)
+
     def get_all_schemes(self, fetch_valid_schemes: bool=True) -> List[Scheme]:
         """
         Retrieve all schemes, optionally filtering for valid schemes based on current date.
@@ -108,3 +128,68 @@ class SchemeService:
             per_page=per_page
         )
 
+    def get_schemes_rows_by_filters(
+        self, 
+        filters: dict = {}, 
+        fetch_valid_schemes: bool = True, 
+        page: int = 1, 
+        per_page: int = 10
+    ) -> Tuple[List[Dict], int]:
+        """
+        Retrieve a page of schemes as plain dictionaries, for read-only listings that need no ORM objects.
+
+        Args:
+            filters (dict): Filters to apply to the query.
+            fetch_valid_schemes (bool): Flag to determine whether to fetch only valid schemes.
+            page (int): The page number for pagination.
+            per_page (int): The number of items per page for pagination.
+
+        Returns:
+            Tuple[List[Dict], int]: The scheme rows, keyed by column name, and the total count of schemes.
+        """
+        return self.crud_operations.get_schemes_rows_by_filters(
+            filters=filters,
+            fetch_valid_schemes=fetch_valid_schemes,
+            page=page,
+            per_page=per_page
+        )
+
+    def get_schemes_version(self, filters: dict = {}, fetch_valid_schemes: bool = True) -> Tuple:
+        """
+        Retrieve a fingerprint of the schemes matching the filters. It changes whenever a matching scheme changes.
+
+        Args:
+            filters (dict): Filters to apply to the query.
+            fetch_valid_schemes (bool): Flag to determine whether to fetch only valid schemes.
+
+        Returns:
+            Tuple: The aggregate values identifying the current state of the matching schemes.
+        """
+        return self.crud_operations.get_schemes_version(filters, fetch_valid_schemes)
+
+    def get_schemes_by_cursor(
+        self, 
+        filters: dict = {}, 
+        fetch_valid_schemes: bool = True, 
+        cursor: Optional[int] = None, 
+        limit: int = 10
+    ) -> Tuple[List[Scheme], Optional[int]]:
+        """
+        Retrieve schemes with optional filters and keyset (cursor) pagination, without a total count.
+
+        Args:
+            filters (dict): Filters to apply to the query.
+            fetch_valid_schemes (bool): Flag to determine whether to fetch only valid schemes.
+            cursor (Optional[int]): The cursor returned with the previous page, or None for the first page.
+            limit (int): The number of items per page.
+
+        Returns:
+            Tuple[List[Scheme], Optional[int]]: A list of schemes and the cursor of the next page (None on the last page).
+        """
+        return self.crud_operations.get_schemes_by_cursor(
+            filters=filters,
+            fetch_valid_schemes=fetch_valid_schemes,
+            cursor=cursor,
+            limit=limit
+        )
+
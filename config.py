@@ -18,6 +18,15 @@ class Config:
     # SERVER_NAME = Env().str('SERVER_NAME')  
     APPLICATION_ROOT = Env().str('APPLICATION_ROOT', '/')  
     PREFERRED_URL_SCHEME = Env().str('PREFERRED_URL_SCHEME', 'http')  
+    LOG_LEVEL = Env().str('LOG_LEVEL', 'INFO').upper()
+    # Connection pool settings for the API engine
+    DB_POOL_SIZE = int(Env().str('DB_POOL_SIZE', "20"))
+    DB_MAX_OVERFLOW = int(Env().str('DB_MAX_OVERFLOW', "10"))
+    DB_POOL_RECYCLE = int(Env().str('DB_POOL_RECYCLE', "300"))  # Seconds before a pooled connection is replaced
+    DB_POOL_PRE_PING = Env().bool('DB_POOL_PRE_PING', True)  # Test connections on checkout to avoid stale-connection errors
+    DB_POOL_USE_LIFO = Env().bool('DB_POOL_USE_LIFO', True)  # Reuse the most recently returned connection first
+    MAX_PAGE_SIZE = int(Env().str('MAX_PAGE_SIZE', "100"))  # Largest page size the list endpoints accept
+    MAX_BULK_APPLICATIONS = int(Env().str('MAX_BULK_APPLICATIONS', "1000"))  # Most applications one bulk create request may contain
 
 class DevelopmentConfig(Config):
     DEBUG = True
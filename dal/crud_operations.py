@@ -24,13 +24,29 @@ Design Patterns:
 
 """
 
-from typing import List, Dict, Optional, Tuple
-from sqlalchemy.orm import Session
+from typing import List, Dict, Optional, Tuple, Iterator, Callable, Set
+from sqlalchemy.orm import Session, Query, selectinload
 from datetime import date
 from dal.models import Administrator, Applicant, HouseholdMember, Scheme, Application, SystemConfiguration
 from sqlalchemy.exc import SQLAlchemyError
 from exceptions import InvalidPaginationParameterException, InvalidSortingParameterException
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, desc, select, func, and_, or_, insert
+from sqlalchemy.sql.elements import ColumnElement
+
+# ORDER BY clauses for every allowed (sort_by, sort_order) pair of an applicants listing, built once at import
+_APPLICANT_SORT_CLAUSES = {
+    (column, order): direction(getattr(Applicant, column))
+    for column in ('name', 'created_at')
+    for order, direction in (('asc', asc), ('desc', desc))
+}
+
+# Loader options of an applications listing. Application.applicant and Application.scheme default to joined eager loading, which repeats
+# the wide scheme JSON columns (and the applicant's columns) on every row of the page and again for each household member. Loading them
+# with SELECT ... IN fetches each distinct applicant (with their household) and each distinct scheme once per page instead.
+_APPLICATION_LISTING_OPTIONS = (
+    selectinload(Application.applicant),
+    selectinload(Application.scheme),
+)
 
 
 class CRUDOperations:
@@ -144,6 +160,36 @@ class CRUDOperations:
         return db_applicant
     
 
+    def iter_applicants_with_household(self, batch_size: int = 500) -> Iterator[List[Applicant]]:
+        """
+        Iterate over every applicant, ordered by ID, with their household members, in batches. Intended for batch jobs that process 
+        the whole applicant base: each batch is fetched with one keyset query (IDs after the last one of the previous batch) and one 
+        SELECT ... IN query for the household members, so only the current batch needs to be held in memory, and the iteration 
+        remains valid when the caller commits between batches.
+
+        Args:
+            batch_size (int): The number of applicants per batch.
+
+        Yields:
+            List[Applicant]: The next batch of applicants.
+        """
+        last_id = None
+        while True:
+            query = self.db_session.query(Applicant).options(selectinload(Applicant.household_members)).order_by(Applicant.id)
+            if last_id is not None:
+                query = query.filter(Applicant.id > last_id)
+            try:
+                batch = query.limit(batch_size).all()
+            except SQLAlchemyError as e:
+                self.db_session.rollback()
+                raise e
+            if not batch:
+                return
+            last_id = batch[-1].id  # Read before yielding: a commit by the caller expires the batch
+            yield batch
+            if len(batch) < batch_size:
+                return
+
     def get_all_applicants(self, 
                         page: int = 1, 
                         page_size: int = 10, 
@@ -163,28 +209,11 @@ class CRUDOperations:
         Returns:
             Tuple[List[Applicant], int]: A tuple containing a list of applicants for the specified page and the total count of applicants.
         """
-        # Validate pagination parameters
-        if page < 1:
-            raise InvalidPaginationParameterException("Page number must be greater than 0.")
-        if page_size < 1:
-            raise InvalidPaginationParameterException("Page size must be greater than 0.")
-
-        # Validate sorting parameters
-        if sort_by not in ['name', 'created_at']:
-            raise InvalidSortingParameterException(f"Invalid sort_by field '{sort_by}'. Allowed values are 'name' or 'created_at'.")
-        if sort_order not in ['asc', 'desc']:
-            raise InvalidSortingParameterException(f"Invalid sort_order '{sort_order}'. Allowed values are 'asc' or 'desc'.")
-
-        # Calculate offset for pagination
-        offset = (page - 1) * page_size
-        
-        # Define sorting criteria
-        sort_column = Applicant.name if sort_by == 'name' else Applicant.created_at
-        sort_direction = asc if sort_order == 'asc' else desc
+        offset, order_by_clause = self._applicants_page_parameters(page, page_size, sort_by, sort_order)
 
         try:
-            # Build base query
-            query = self.db_session.query(Applicant)
+            # Build base query; household members are fetched for the whole page in one extra SELECT ... IN query
+            query = self.db_session.query(Applicant).options(selectinload(Applicant.household_members))
 
             # Apply filters if provided
             if filters:
@@ -193,7 +222,7 @@ class CRUDOperations:
 
             # Apply sorting, pagination, and execute query
             applicants = (query
-                        .order_by(sort_direction(sort_column))
+                        .order_by(order_by_clause)
                         .offset(offset)
                         .limit(page_size)
                         .all())
@@ -208,6 +237,127 @@ class CRUDOperations:
             self.db_session.rollback()
             raise e
         
+    def get_applicants_rows_by_filters(self, 
+                        page: int = 1, 
+                        page_size: int = 10, 
+                        sort_by: Optional[str] = 'name', 
+                        sort_order: Optional[str] = 'asc', 
+                        filters: Optional[Dict[str, any]] = None) -> Tuple[List[Dict], int]:
+        """
+        Retrieve a page of applicants as plain dictionaries for read-only listings.
+        Uses Core SELECTs on the Applicants and HouseholdMembers tables, so no ORM objects are materialized or tracked by the session.
+
+        Args:
+            page (int): The page number to retrieve.
+            page_size (int): The number of applicants to retrieve per page.
+            sort_by (Optional[str]): The field to sort by ('name' or 'created_at').
+            sort_order (Optional[str]): The sort order ('asc' or 'desc').
+            filters (Optional[Dict[str, any]]): A dictionary of filters to apply to the query.
+
+        Returns:
+            Tuple[List[Dict], int]: A tuple containing the applicant rows for the specified page, each with a 'household_members' list of member rows, 
+            and the total count of applicants.
+        """
+        offset, order_by_clause = self._applicants_page_parameters(page, page_size, sort_by, sort_order)
+        applicants_table = Applicant.__table__
+        members_table = HouseholdMember.__table__
+
+        try:
+            criteria = [applicants_table.c[attribute] == value for attribute, value in (filters or {}).items()]
+
+            # The total count of matching applicants rides along on every row as a window aggregate, saving a separate COUNT(*) round trip
+            rows = [dict(row._mapping) for row in self.db_session.execute(
+                select(applicants_table, func.count().over().label('_total'))
+                .where(*criteria)
+                .order_by(order_by_clause)
+                .offset(offset)
+                .limit(page_size))]
+            if rows:
+                total_count = rows[0]['_total']
+                for row in rows:
+                    del row['_total']
+            elif offset == 0:
+                total_count = 0
+            else:
+                # A page past the end returns no rows to read the total from
+                total_count = self.db_session.execute(select(func.count()).select_from(applicants_table).where(*criteria)).scalar_one()
+
+            # Fetch the household members of the whole page in one query and attach them to their applicants
+            members_by_applicant = {row['id']: [] for row in rows}
+            for row in rows:
+                row['household_members'] = members_by_applicant[row['id']]
+            if members_by_applicant:
+                for member in self.db_session.execute(
+                        select(members_table).where(members_table.c.applicant_id.in_(list(members_by_applicant)))):
+                    members_by_applicant[member.applicant_id].append(dict(member._mapping))
+
+            return rows, total_count
+
+        except SQLAlchemyError as e:
+            # Handle any SQLAlchemy errors
+            self.db_session.rollback()
+            raise e
+
+    def get_applicants_version(self, filters: Optional[Dict[str, any]] = None) -> Tuple:
+        """
+        Retrieve a cheap fingerprint of the applicants matching the filters, for conditional (ETag) responses.
+        Any insert, update or delete of a matching applicant or of one of their household members changes the result.
+
+        Args:
+            filters (Optional[Dict[str, any]]): A dictionary of filters to apply to the query.
+
+        Returns:
+            Tuple: (applicant count, latest applicant change, highest applicant ID, household member count, latest household member change)
+        """
+        applicants_table = Applicant.__table__
+        members_table = HouseholdMember.__table__
+        criteria = [applicants_table.c[attribute] == value for attribute, value in (filters or {}).items()]
+        matching_ids = select(applicants_table.c.id).where(*criteria)
+
+        # Household member aggregates run as uncorrelated scalar subqueries so everything comes back in one round trip
+        members_count = (select(func.count())
+                         .where(members_table.c.applicant_id.in_(matching_ids))
+                         .correlate(None).scalar_subquery())
+        members_last_change = (select(func.max(func.coalesce(members_table.c.updated_at, members_table.c.created_at)))
+                               .where(members_table.c.applicant_id.in_(matching_ids))
+                               .correlate(None).scalar_subquery())
+        try:
+            return tuple(self.db_session.execute(
+                select(func.count(),
+                       func.max(func.coalesce(applicants_table.c.updated_at, applicants_table.c.created_at)),
+                       func.max(applicants_table.c.id),
+                       members_count,
+                       members_last_change)
+                .where(*criteria)).one())
+        except SQLAlchemyError as e:
+            # Handle any SQLAlchemy errors
+            self.db_session.rollback()
+            raise e
+
+    def _applicants_page_parameters(self, page: int, page_size: int, sort_by: str, sort_order: str) -> Tuple[int, ColumnElement]:
+        """
+        Validate the pagination and sorting parameters of an applicants listing.
+
+        Returns:
+            Tuple[int, ColumnElement]: The row offset and the precomputed ORDER BY clause.
+        """
+        # Validate pagination parameters
+        if page < 1:
+            raise InvalidPaginationParameterException("Page number must be greater than 0.")
+        if page_size < 1:
+            raise InvalidPaginationParameterException("Page size must be greater than 0.")
+
+        # Validate sorting parameters with a single lookup; the specific message is only worked out on failure
+        order_by_clause = _APPLICANT_SORT_CLAUSES.get((sort_by, sort_order))
+        if order_by_clause is None:
+            if sort_by not in ['name', 'created_at']:
+                raise InvalidSortingParameterException(f"Invalid sort_by field '{sort_by}'. Allowed values are 'name' or 'created_at'.")
+            raise InvalidSortingParameterException(f"Invalid sort_order '{sort_order}'. Allowed values are 'asc' or 'desc'.")
+
+        # Calculate offset for pagination
+        offset = (page - 1) * page_size
+        return offset, order_by_clause
+
     def get_applicant(self, applicant_id: int) -> Optional[Applicant]:
         """
         Retrieve an applicant by ID.
@@ -219,6 +369,23 @@ class CRUDOperations:
             Optional[Applicant]: The Applicant object if found, otherwise None.
         """
         return self.db_session.query(Applicant).filter(Applicant.id == applicant_id).first()
+
+    def get_applicants_by_ids(self, applicant_ids: List[int]) -> List[Applicant]:
+        """
+        Retrieve several applicants by ID, with their household members, in two queries.
+
+        Args:
+            applicant_ids (List[int]): The IDs of the applicants.
+
+        Returns:
+            List[Applicant]: The applicants found, in no particular order. IDs without an applicant are left out.
+        """
+        if not applicant_ids:
+            return []
+        return (self.db_session.query(Applicant)
+                .options(selectinload(Applicant.household_members))
+                .filter(Applicant.id.in_(applicant_ids))
+                .all())
     
     def create_applicant(self, applicant_data: Dict, household_members_data: Optional[List[Dict]] = []) -> Applicant:
         """
@@ -233,18 +400,14 @@ class CRUDOperations:
         """
         # Begin a transaction
         try:
-            # Create the applicant instance
+            # Create the applicant with its household members attached through the relationship. 
+            # The unit of work inserts the applicant first, links the members to its generated id, 
+            # and inserts all household members in a single batched (executemany) INSERT.
             db_applicant = Applicant(**applicant_data)
+            db_applicant.household_members = [HouseholdMember(**member_data) for member_data in household_members_data]
             self.db_session.add(db_applicant)
-            self.db_session.flush()  # Flush to generate applicant.id
-
-            # Create household member instances
-            for member_data in household_members_data:
-                member_data['applicant_id'] = db_applicant.id  # Link household members to the applicant
-                db_household_member = HouseholdMember(**member_data)
-                self.db_session.add(db_household_member)
 
-            # Commit transaction to save both applicant and household members
+            # Commit transaction to save both applicant and household members in one flush
             self.db_session.commit()
             self.db_session.refresh(db_applicant)
             return db_applicant
@@ -256,6 +419,34 @@ class CRUDOperations:
         
     
 
+    def create_applicants(self, applicants_data: List[Dict], household_members_data: List[List[Dict]]) -> List[int]:
+        """
+        Create several applicants and their household members in a single transaction, without building ORM objects.
+
+        Args:
+            applicants_data (List[Dict]): A list of dictionaries containing each applicant's data.
+            household_members_data (List[List[Dict]]): The household members' data of each applicant, in the same order.
+
+        Returns:
+            List[int]: The IDs of the created applicants, in the order of applicants_data.
+        """
+        try:
+            # Bulk INSERTs: one INSERT ... RETURNING executemany for the applicants, whose ids are returned in the order of the rows, 
+            # then one executemany for all the household members. No ORM object or identity map entry is created along the way.
+            applicant_ids = list(self.db_session.scalars(insert(Applicant).returning(Applicant.id, sort_by_parameter_order=True), applicants_data))
+            members_rows = [dict(member_data, applicant_id=applicant_id)
+                            for applicant_id, members_data in zip(applicant_ids, household_members_data)
+                            for member_data in members_data]
+            if members_rows:
+                self.db_session.execute(insert(HouseholdMember), members_rows)
+            self.db_session.commit()
+            return applicant_ids
+
+        except SQLAlchemyError as e:
+            # Rollback transaction in case of any errors
+            self.db_session.rollback()
+            raise e
+
     def get_applicants_by_filters(self, filters: Dict) -> List[Applicant]:
         """
         Retrieve multiple applicants based on common filters.
@@ -266,7 +457,7 @@ class CRUDOperations:
         Returns:
             List[Applicant]: A list of Applicant objects that match the filters.
         """
-        query = self.db_session.query(Applicant)
+        query = self.db_session.query(Applicant).options(selectinload(Applicant.household_members))
         for attribute, value in filters.items():
             query = query.filter(getattr(Applicant, attribute) == value)
         return query.all()
@@ -388,6 +579,24 @@ class CRUDOperations:
         self.db_session.refresh(db_scheme)
         return db_scheme
 
+    def create_schemes(self, schemes_data: List[Dict]) -> List[int]:
+        """
+        Create several schemes with one bulk INSERT and one commit, without building ORM objects.
+
+        Args:
+            schemes_data (List[Dict]): A list of dictionaries, each containing a scheme's data.
+
+        Returns:
+            List[int]: The IDs of the created schemes, in the order of schemes_data.
+        """
+        try:
+            scheme_ids = list(self.db_session.scalars(insert(Scheme).returning(Scheme.id, sort_by_parameter_order=True), schemes_data))
+            self.db_session.commit()
+            return scheme_ids
+        except SQLAlchemyError as e:
+            self.db_session.rollback()
+            raise e
+
     def get_scheme(self, scheme_id: int) -> Optional[Scheme]:
         """
         Retrieve a scheme by ID.
@@ -399,6 +608,34 @@ class CRUDOperations:
             Optional[Scheme]: The Scheme object if found, otherwise None.
         """
         return self.db_session.query(Scheme).filter(Scheme.id == scheme_id).first()
+
+    def get_existing_scheme_names(self, names: List[str]) -> Set[str]:
+        """
+        Find which of the given scheme names are already taken, in one query.
+
+        Args:
+            names (List[str]): The scheme names to look up.
+
+        Returns:
+            Set[str]: The names among names that a scheme already has.
+        """
+        if not names:
+            return set()
+        return set(self.db_session.scalars(select(Scheme.name).where(Scheme.name.in_(names))))
+
+    def get_schemes_by_ids(self, scheme_ids: List[int]) -> List[Scheme]:
+        """
+        Retrieve several schemes by ID in one query.
+
+        Args:
+            scheme_ids (List[int]): The IDs of the schemes.
+
+        Returns:
+            List[Scheme]: The schemes found, in no particular order. IDs without a scheme are left out.
+        """
+        if not scheme_ids:
+            return []
+        return self.db_session.query(Scheme).filter(Scheme.id.in_(scheme_ids)).all()
     
 
 
@@ -428,26 +665,132 @@ class CRUDOperations:
         if per_page < 1:
             raise InvalidPaginationParameterException("Page size must be greater than 0.")
         
-        query = self.db_session.query(Scheme)
+        # Order by ID, as the cursor mode does, so that OFFSET pages are stable and disjoint
+        query = self._schemes_query(filters, fetch_valid_schemes).order_by(Scheme.id)
+
+        # Apply pagination; the total count rides along on the page query
+        return self._page_with_total(query, (page - 1) * per_page, per_page)
+
+    def get_schemes_rows_by_filters(
+    self, 
+    filters: Dict, 
+    fetch_valid_schemes: bool = True, 
+    page: int = 1, 
+    per_page: int = 10
+    ) -> Tuple[List[Dict], int]:
+        """
+        Retrieve a page of schemes as plain dictionaries for read-only listings, in the same order as get_schemes_by_filters.
+        Uses a Core SELECT on the Schemes table, so no ORM objects are materialized or tracked by the session.
+
+        Args:
+            filters (Dict): A dictionary of filters (e.g., {"validity_start_date": "2023-01-01"}).
+            fetch_valid_schemes (bool): Flag to determine whether to fetch only schemes valid as of today's date.
+            page (int): The page number for pagination.
+            per_page (int): The number of schemes per page.
+
+        Returns:
+            Tuple[List[Dict], int]: A tuple containing the scheme rows (keyed by column name) for the specified page and 
+                                    the total count of schemes.
+        """
+        if page < 1:
+            raise InvalidPaginationParameterException("Page number must be greater than 0.")
+        if per_page < 1:
+            raise InvalidPaginationParameterException("Page size must be greater than 0.")
+
+        schemes_table = Scheme.__table__
+        criteria = self._schemes_criteria(filters, fetch_valid_schemes)
+        offset = (page - 1) * per_page
+
+        try:
+            # The total count of matching schemes rides along on every row as a window aggregate, saving a separate COUNT(*) round trip
+            rows = [dict(row._mapping) for row in self.db_session.execute(
+                select(schemes_table, func.count().over().label('_total'))
+                .where(*criteria)
+                .order_by(schemes_table.c.id)
+                .offset(offset)
+                .limit(per_page))]
+            if rows:
+                total_count = rows[0]['_total']
+                for row in rows:
+                    del row['_total']
+            elif offset == 0:
+                total_count = 0
+            else:
+                # A page past the end returns no rows to read the total from
+                total_count = self.db_session.execute(select(func.count()).select_from(schemes_table).where(*criteria)).scalar_one()
+            return rows, total_count
+
+        except SQLAlchemyError as e:
+            # Handle any SQLAlchemy errors
+            self.db_session.rollback()
+            raise e
 
+    def get_schemes_by_cursor(
+    self, 
+    filters: Dict, 
+    fetch_valid_schemes: bool = True, 
+    cursor: Optional[int] = None, 
+    limit: int = 10
+    ) -> Tuple[List[Scheme], Optional[int]]:
+        """
+        Retrieve schemes in ID order with keyset (cursor) pagination. Unlike get_schemes_by_filters, no total count is computed.
+
+        Args:
+            filters (Dict): A dictionary of filters (e.g., {"validity_start_date": "2023-01-01"}).
+            fetch_valid_schemes (bool): Flag to determine whether to fetch only schemes valid as of today's date.
+            cursor (Optional[int]): The ID of the last scheme of the previous page, or None for the first page.
+            limit (int): The number of schemes per page.
+
+        Returns:
+            Tuple[List[Scheme], Optional[int]]: A tuple containing the schemes after the cursor and the cursor of the next page, 
+                                    which is None on the last page.
+        """
+        if limit < 1:
+            raise InvalidPaginationParameterException("Page size must be greater than 0.")
+
+        query = self._schemes_query(filters, fetch_valid_schemes)
+        if cursor is not None:
+            query = query.filter(Scheme.id > cursor)
+
+        return self._keyset_page(query.order_by(Scheme.id), limit)
+
+    def get_schemes_version(self, filters: Dict, fetch_valid_schemes: bool = True) -> Tuple:
+        """
+        Retrieve a cheap fingerprint of the schemes matching the filters, for conditional (ETag) responses.
+        Any insert, update or delete of a matching scheme changes the result, and so does the passing of a day when only valid schemes are listed.
+
+        Args:
+            filters (Dict): A dictionary of filters (e.g., {"validity_start_date": "2023-01-01"}).
+            fetch_valid_schemes (bool): Flag to determine whether to fetch only schemes valid as of today's date.
+
+        Returns:
+            Tuple: (scheme count, latest scheme change, highest scheme ID, today's date or None)
+        """
+        query = self._schemes_query(filters, fetch_valid_schemes).with_entities(
+            func.count(),
+            func.max(func.coalesce(Scheme.updated_at, Scheme.created_at)),
+            func.max(Scheme.id))
+        return tuple(query.one()) + (date.today() if fetch_valid_schemes else None,)
+
+    def _schemes_query(self, filters: Dict, fetch_valid_schemes: bool) -> Query:
+        """
+        Build the filtered (but unordered and unpaginated) query of a schemes listing.
+        """
+        return self.db_session.query(Scheme).filter(*self._schemes_criteria(filters, fetch_valid_schemes))
+
+    def _schemes_criteria(self, filters: Dict, fetch_valid_schemes: bool) -> List:
+        """
+        Build the WHERE criteria of a schemes listing, shared by the ORM and Core queries.
+        """
         # Apply filters provided in the function argument
-        for attribute, value in filters.items():
-            query = query.filter(getattr(Scheme, attribute) == value)
+        criteria = [getattr(Scheme, attribute) == value for attribute, value in filters.items()]
 
         # Apply validity date filtering if fetch_valid_schemes is True
         if fetch_valid_schemes:
             today = date.today()
-            query = query.filter(Scheme.validity_start_date <= today).filter(
-                (Scheme.validity_end_date.is_(None)) | (Scheme.validity_end_date >= today)
-            )
-
-        # Get total count before applying pagination
-        total_count = query.count()
-
-        # Apply pagination
-        schemes = query.offset((page - 1) * per_page).limit(per_page).all()
-
-        return schemes, total_count
+            criteria.append(Scheme.validity_start_date <= today)
+            criteria.append((Scheme.validity_end_date.is_(None)) | (Scheme.validity_end_date >= today))
+        return criteria
 
     def update_scheme(self, scheme_id: int, update_data: Dict) -> Optional[Scheme]:
         """
@@ -492,6 +835,70 @@ class CRUDOperations:
             Application.status == "approved"  # Only look for approved applications
         ).first()
 
+    def get_approved_scheme_ids_for_applicants(self, applicant_ids: List[int]) -> Dict[int, Set[int]]:
+        """
+        Retrieve the IDs of the schemes each of several applicants already has an approved application for, in one query.
+        This is the batch counterpart of get_approved_application_by_applicant_and_scheme, for pre-eligibility checks across many schemes.
+
+        Args:
+            applicant_ids (List[int]): The IDs of the applicants.
+
+        Returns:
+            Dict[int, Set[int]]: The approved scheme IDs keyed by applicant ID. Applicants without approved applications are left out.
+        """
+        if not applicant_ids:
+            return {}
+        rows = self.db_session.query(Application.applicant_id, Application.scheme_id).filter(
+            Application.applicant_id.in_(applicant_ids),
+            Application.status == "approved"  # Only look for approved applications
+        ).distinct()
+        approved_scheme_ids: Dict[int, Set[int]] = {}
+        for applicant_id, scheme_id in rows:
+            approved_scheme_ids.setdefault(applicant_id, set()).add(scheme_id)
+        return approved_scheme_ids
+
+    def create_applications(self, applications_data: List[Dict]) -> List[Application]:
+        """
+        Create several applications in a single transaction.
+
+        Args:
+            applications_data (List[Dict]): A list of dictionaries, each containing an application's data.
+
+        Returns:
+            List[Application]: The created Application objects, in the order of applications_data, with their applicant and scheme loaded.
+        """
+        db_applications = [Application(**application_data) for application_data in applications_data]
+        self.db_session.add_all(db_applications)
+        try:
+            self.db_session.flush()
+            application_ids = [db_application.id for db_application in db_applications]
+            self.db_session.commit()
+        except SQLAlchemyError as e:
+            self.db_session.rollback()
+            raise e
+        # The commit expires the created objects, which would otherwise be refreshed with one SELECT each on first use
+        return self.get_applications_by_ids(application_ids)
+
+    def get_applications_by_ids(self, application_ids: List[int]) -> List[Application]:
+        """
+        Retrieve several applications by ID with one query, with their applicant and scheme loaded as in an applications listing.
+
+        Args:
+            application_ids (List[int]): The IDs of the applications.
+
+        Returns:
+            List[Application]: The Application objects found, in the order of application_ids.
+        """
+        if not application_ids:
+            return []
+        applications = {
+            application.id: application
+            for application in self.db_session.query(Application)
+                                    .options(*_APPLICATION_LISTING_OPTIONS)
+                                    .filter(Application.id.in_(application_ids))
+        }
+        return [applications[application_id] for application_id in application_ids if application_id in applications]
+
     def create_application(self, application_data: Dict) -> Application:
         """
         Create a new application.
@@ -525,6 +932,42 @@ class CRUDOperations:
         Returns:
             Tuple[List[Application], int]: A tuple containing a list of applications for the specified page and the total count of applications.
         """
+        query, offset = self._applications_page_query(page, page_size, sort_by, sort_order)
+        return self._page_with_total(query, offset, page_size)
+
+    def iter_all_applications(self, 
+                            page: int = 1, 
+                            page_size: int = 10, 
+                            sort_by: Optional[str] = 'created_at', 
+                            sort_order: Optional[str] = 'asc', 
+                            batch_size: int = 50) -> Tuple[Iterator[Tuple[Application, int]], Callable[[], int]]:
+        """
+        Retrieve a page of applications like get_all_applications, but fetch and hydrate the rows in batches as they are consumed, 
+        so a large page can be serialized incrementally instead of being materialized at once.
+        The parameters are validated and the query is executed before this method returns.
+
+        Args:
+            page (int): The page number to retrieve.
+            page_size (int): The number of applications to retrieve per page.
+            sort_by (Optional[str]): The field to sort by ('created_at').
+            sort_order (Optional[str]): The sort order ('asc' or 'desc').
+            batch_size (int): The number of rows fetched from the cursor at a time.
+
+        Returns:
+            Tuple[Iterator[Tuple[Application, int]], Callable[[], int]]: An iterator of (application, total count of applications) rows, 
+            and a function returning the total count for when the page has no rows to read it from.
+        """
+        query, offset = self._applications_page_query(page, page_size, sort_by, sort_order)
+        rows = iter(query.add_columns(func.count().over()).offset(offset).limit(page_size).yield_per(batch_size))
+        return rows, query.order_by(None).count
+
+    def _applications_page_query(self, page: int, page_size: int, sort_by: str, sort_order: str) -> Tuple[Query, int]:
+        """
+        Validate the pagination and sorting parameters of an applications listing and build its ordered query.
+
+        Returns:
+            Tuple[Query, int]: The ordered (but not yet paginated) query and the row offset of the page.
+        """
         # Validate pagination parameters
         if page < 1:
             raise InvalidPaginationParameterException("Page number must be greater than 0.")
@@ -544,18 +987,70 @@ class CRUDOperations:
         sort_column = Application.created_at
         sort_direction = asc if sort_order == 'asc' else desc
 
-        # Retrieve applications from the database with pagination and sorting
-        applications = (self.db_session
-                        .query(Application)
-                        .order_by(sort_direction(sort_column))
-                        .offset(offset)
-                        .limit(page_size)
-                        .all())
-        
-        # Retrieve total count of applications for pagination purposes
-        total_count = self.db_session.query(Application).count()
+        # Applications from the database with sorting
+        query = (self.db_session.query(Application)
+                 .options(*_APPLICATION_LISTING_OPTIONS)
+                 .order_by(sort_direction(sort_column), sort_direction(Application.id)))
+        return query, offset
+
+    def get_applications_by_cursor(self, 
+                            cursor: Optional[int] = None, 
+                            limit: int = 10, 
+                            sort_order: Optional[str] = 'asc') -> Tuple[List[Application], Optional[int]]:
+        """
+        Retrieve applications ordered by creation time with keyset (cursor) pagination. Unlike get_all_applications, no total count is computed 
+        and the cost of a page does not grow with its depth.
 
-        return applications, total_count
+        Args:
+            cursor (Optional[int]): The ID of the last application of the previous page, or None for the first page.
+            limit (int): The number of applications to retrieve per page.
+            sort_order (Optional[str]): The sort order ('asc' or 'desc').
+
+        Returns:
+            Tuple[List[Application], Optional[int]]: A tuple containing the applications after the cursor and the cursor of the next page, 
+                                    which is None on the last page.
+        """
+        if limit < 1:
+            raise InvalidPaginationParameterException("Page size must be greater than 0.")
+        if sort_order not in ['asc', 'desc']:
+            raise InvalidSortingParameterException(f"Invalid sort_order '{sort_order}'. Allowed values are 'asc' or 'desc'.")
+
+        sort_direction = asc if sort_order == 'asc' else desc
+        query = self.db_session.query(Application).options(*_APPLICATION_LISTING_OPTIONS)
+        if cursor is not None:
+            # Resume strictly after the (created_at, id) position of the cursor row. Its created_at is read in SQL so 
+            # the comparison is made on the stored representation of the timestamp.
+            cursor_created_at = select(Application.created_at).where(Application.id == cursor).scalar_subquery()
+            if sort_order == 'asc':
+                query = query.filter(or_(Application.created_at > cursor_created_at,
+                                         and_(Application.created_at == cursor_created_at, Application.id > cursor)))
+            else:
+                query = query.filter(or_(Application.created_at < cursor_created_at,
+                                         and_(Application.created_at == cursor_created_at, Application.id < cursor)))
+
+        return self._keyset_page(query.order_by(sort_direction(Application.created_at), sort_direction(Application.id)), limit)
+
+    def get_applications_version(self) -> Tuple:
+        """
+        Retrieve a fingerprint of the applications listing, for conditional (ETag) responses.
+        Listed applications embed their applicant, the applicant's household members and the scheme, so a change to any of 
+        these tables changes the result as well.
+
+        Returns:
+            Tuple: (row count, latest change, highest ID) for each of the Applications, Applicants, HouseholdMembers and Schemes tables.
+        """
+        aggregates = []
+        for model in (Application, Applicant, HouseholdMember, Scheme):
+            # Uncorrelated scalar subqueries, so all the tables are fingerprinted in one round trip
+            aggregates.extend(
+                select(aggregate).select_from(model.__table__).correlate(None).scalar_subquery()
+                for aggregate in (func.count(), func.max(func.coalesce(model.updated_at, model.created_at)), func.max(model.id)))
+        try:
+            return tuple(self.db_session.execute(select(*aggregates)).one())
+        except SQLAlchemyError as e:
+            # Handle any SQLAlchemy errors
+            self.db_session.rollback()
+            raise e
 
     def get_application(self, application_id: int) -> Optional[Application]:
         """
@@ -609,4 +1104,34 @@ class CRUDOperations:
         self.db_session.query(Application).filter(Application.id == application_id).delete()
         self.db_session.commit()
 
-    
\ No newline at end of file
+    # ===============================
+    # Pagination helpers
+    # ===============================
+
+    def _page_with_total(self, query: Query, offset: int, limit: int) -> Tuple[List, int]:
+        """
+        Retrieve one OFFSET/LIMIT page of an ordered ORM query together with the total count of matching rows.
+        The total rides along on every row as a COUNT(*) OVER () window aggregate, so a page costs a single round trip.
+
+        Returns:
+            Tuple[List, int]: The entities of the page and the total count.
+        """
+        rows = query.add_columns(func.count().over()).offset(offset).limit(limit).all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        if offset == 0:
+            return [], 0
+        # A page past the end returns no rows to read the total from
+        return [], query.order_by(None).count()
+
+    def _keyset_page(self, query: Query, limit: int) -> Tuple[List, Optional[int]]:
+        """
+        Retrieve one keyset page of an ordered ORM query. One row beyond the limit is fetched to tell whether a next page exists.
+
+        Returns:
+            Tuple[List, Optional[int]]: The entities of the page and the ID of the last one as the next cursor, or None on the last page.
+        """
+        items = query.limit(limit + 1).all()
+        if len(items) > limit:
+            return items[:limit], items[limit - 1].id
+        return items, None
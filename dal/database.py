@@ -15,8 +15,14 @@ DATABASE_URL = Env().str("DATABASE_URL", "DATABASE_URL is not set.")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set. Please configure your environment variables.")
 
-# Create the SQLAlchemy engine
-engine = create_engine(DATABASE_URL)
+# Create the SQLAlchemy engine used by the batch and data-prep scripts. Its pool is sized and tuned with the same environment 
+# variables (and defaults) as the API engine's in config.py, so that a heavy batch job can be given more connections via DB_POOL_SIZE.
+# (config.Config is not imported here because it requires the API's secrets, which the scripts do not need.)
+engine = create_engine(DATABASE_URL,
+                       pool_size=int(Env().str('DB_POOL_SIZE', "20")),
+                       max_overflow=int(Env().str('DB_MAX_OVERFLOW', "10")),
+                       pool_pre_ping=Env().bool('DB_POOL_PRE_PING', True),  # Test connections on checkout to avoid stale-connection errors
+                       pool_recycle=int(Env().str('DB_POOL_RECYCLE', "300")))  # Seconds before a pooled connection is replaced
 
 # Create a configured "Session" class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
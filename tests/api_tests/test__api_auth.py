@@ -157,3 +157,15 @@ def test_reset_admin_password_nonexistent_user(api_test_client, api_test_db__Non
     finally:
         AS.delete_administrator(temp_admin.id)
         assert AS.get_administrator_by_id(temp_admin.id) is None
+
+
+def test_jsonify_uses_orjson_provider(api_test_client):
+    """
+    jsonify responses (such as the login error) are encoded by the app's orjson-backed JSON provider.
+    """
+    from api.utils.json import OrjsonProvider, json_bytes
+    assert isinstance(api_test_client.application.json, OrjsonProvider)
+
+    response = api_test_client.post('/api/auth/login', json={'username': str(uuid.uuid4()), 'password': 'wrong_password'})
+    assert response.status_code == 401
+    assert response.get_data() == json_bytes(response.get_json())  # Compact orjson encoding, no trailing newline
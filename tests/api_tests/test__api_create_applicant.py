@@ -1,6 +1,9 @@
 # Copyright (c) 2024 by Jonathan AW
 
 import pytest
+import json
+from marshmallow import ValidationError
+from api.schemas.all_schemas import ApplicantSchema
 from bl.services.applicant_service import ApplicantService
 from dal.crud_operations import CRUDOperations
 from exceptions import ApplicantNotFoundException
@@ -122,3 +125,50 @@ def test__api_create_applicant_invalid_household_member_data(api_test_client, ap
     assert response.status_code == 400  # Expect a 400 Bad Request status due to invalid relation type
     data = response.get_json()
     assert 'errors' in data
+
+
+def test__api_create_applicant_malformed_json(api_test_client, api_test_admin):
+    """
+    Test creating an applicant with a request body that is not valid JSON.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    # Step 2: Send POST request with a truncated JSON body
+    response = api_test_client.post(
+        '/api/applicants',
+        data='{"name": "Jane Doe", ',
+        content_type='application/json',
+        headers={'Authorization': f'Bearer {access_token}'}
+    )
+
+    assert response.status_code == 400  # Expect a 400 Bad Request status
+    data = response.get_json()
+    assert data['error'] == 'Invalid JSON payload'
+
+
+@pytest.mark.parametrize("applicant_data", [
+    {"name": "", "employment_status": "unemployed"},
+    {"name": "x" * 256, "employment_status": "retired", "sex": "X", "date_of_birth": "1980-01-01", "marital_status": None, "id": 5},
+    {"name": "Jane Doe", "employment_status": "employed", "sex": "F", "date_of_birth": 19800101, "marital_status": "single",
+     "created_by_admin_id": "abc", "household_members": [{"relation": "cousin", "date_of_birth": "2010-13-10T00:00:00"}, "not a member"]},
+    {"name": "Jane Doe", "employment_status": "employed", "sex": "F", "date_of_birth": "1980-01-01T00:00:00", "marital_status": "single",
+     "household_members": {"name": "Not a list"}},
+    {"name": "Jane Doe", "employment_status": "employed", "sex": "F", "date_of_birth": "1980-01-01T10", "marital_status": "single",
+     "marriage_date": "2005-06-01", "household_members": None},
+    {"name": "Jane Doe", "employment_status": "employed", "sex": "F", "date_of_birth": "1980-01-01T10:30", "marital_status": "single",
+     "household_members": [{"name": None, "relation": "child", "date_of_birth": None, "applicant_id": True}]},
+])
+def test__api_create_applicant_validation_errors_match_schema(api_test_client, api_test_admin, applicant_data):
+    """
+    Test that an invalid applicants POST body is answered with ApplicantSchema's own validation messages.
+    """
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    with pytest.raises(ValidationError) as exc_info:
+        ApplicantSchema().load(applicant_data)
+
+    response = api_test_client.post('/api/applicants', json=applicant_data, headers={'Authorization': f'Bearer {access_token}'})
+    assert response.status_code == 400
+    # JSON object keys are strings, so the list indexes of the household member errors come back as strings
+    assert response.get_json()['errors'] == json.loads(json.dumps(exc_info.value.messages))
@@ -3,9 +3,11 @@
 
 
 import pytest
+from sqlalchemy.exc import SQLAlchemyError
 from bl.services.application_service import ApplicationService
 from tests.conftest import helper
 from exceptions import InvalidApplicationDataException
+from config import Config
 
 
 
@@ -108,3 +110,65 @@ def test__api_create_application_invalid_applicant_id(api_test_client, api_test_
     assert response.status_code == 400
     assert 'error' in data
 
+
+
+@pytest.mark.parametrize("payload", [
+    {"applicant_id": 1, "scheme_id": 1},  # Not a list
+    [],  # Empty
+    [{"applicant_id": 1}],  # Missing scheme_id
+    [{"applicant_id": "1", "scheme_id": 1}],  # Not an integer
+])
+def test__api_create_applications_bulk_invalid_payload(api_test_client, api_test_admin, payload):
+    """
+    Negative test: Verify that the bulk endpoint rejects a body that is not a non-empty list of (applicant_id, scheme_id) pairs.
+    """
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    response = api_test_client.post('/api/applications/bulk', json=payload, headers={'Authorization': f'Bearer {access_token}'})
+
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test__api_create_applications_bulk_too_many(api_test_client, api_test_admin, monkeypatch):
+    """
+    Negative test: Verify that the bulk endpoint rejects more applications than Config.MAX_BULK_APPLICATIONS.
+    """
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+    monkeypatch.setattr(Config, 'MAX_BULK_APPLICATIONS', 2)
+
+    payload = [{"applicant_id": 1, "scheme_id": scheme_id} for scheme_id in range(1, 4)]
+    response = api_test_client.post('/api/applications/bulk', json=payload, headers={'Authorization': f'Bearer {access_token}'})
+
+    assert response.status_code == 400
+    assert 'more than 2' in response.get_json()['error']
+
+
+def test__api_create_applications_bulk_invalid_applicant_id(api_test_client, api_test_admin):
+    """
+    Negative test: Verify that the bulk endpoint returns a 400 error when an applicant does not exist.
+    """
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    payload = [{"applicant_id": 9999, "scheme_id": 1}]
+    response = api_test_client.post('/api/applications/bulk', json=payload, headers={'Authorization': f'Bearer {access_token}'})
+
+    assert response.status_code == 400
+    assert 'not found' in response.get_json()['error']
+
+
+def test__api_create_applications_bulk_database_error(api_test_client, api_test_admin, monkeypatch):
+    """
+    Negative test: Verify that a database error in the bulk endpoint is answered by the app-level handler with a 500 error, without its details.
+    """
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    def fail(*args, **kwargs):
+        raise SQLAlchemyError("SELECT secret FROM Applicants")
+
+    monkeypatch.setattr(ApplicationService, 'create_applications_for_pairs', fail)
+
+    response = api_test_client.post('/api/applications/bulk', json=[{"applicant_id": 1, "scheme_id": 1}], headers={'Authorization': f'Bearer {access_token}'})
+
+    assert response.status_code == 500
+    assert response.get_json() == {'error': 'A database error occurred.'}
@@ -2,7 +2,10 @@
 
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, raiseload
+from api import api_engine
 from tests.conftest import helper 
 
 def test__api_get_applicants_success(api_test_client, api_test_admin):
@@ -102,6 +105,37 @@ def test__api_get_applicants_invalid_pagination_parameter(api_test_client, api_t
     assert 'error' in data
     assert data['error'] == "Page number must be greater than 0."
 
+def test__api_get_applicants_non_integer_pagination_parameter(api_test_client, api_test_admin):
+    """
+    Negative test: Verify that the API returns a 400 error when page or page_size is not an integer.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    response = api_test_client.get('/api/applicants?page=one&page_size=10' ,headers={'Authorization': f'Bearer {access_token}'})
+    data = response.get_json()
+
+    assert response.status_code == 400
+    assert data['error'] == "Page number and page size must be integers."
+
+def test__api_get_applicants_sqlalchemy_error(api_test_client, api_test_admin, monkeypatch):
+    """
+    Negative test: Simulate a SQLAlchemy error and verify that the app-level handler returns a 500 error.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    # Make the service raise an SQLAlchemyError
+    def raise_sqlalchemy_error(*args, **kwargs):
+        raise SQLAlchemyError("Database error occurred")
+    monkeypatch.setattr('bl.services.applicant_service.ApplicantService.get_all_applicants_rows', raise_sqlalchemy_error)
+
+    response = api_test_client.get('/api/applicants' ,headers={'Authorization': f'Bearer {access_token}'})
+    data = response.get_json()
+
+    assert response.status_code == 500
+    assert data['error'] == "A database error occurred."
+
 def test__api_get_applicants_filter_by_multiple_criteria(api_test_client, api_test_admin):
     """
     Positive test: Verify that the API correctly filters applicants by multiple criteria.
@@ -122,3 +156,81 @@ def test__api_get_applicants_filter_by_multiple_criteria(api_test_client, api_te
         assert applicant['employment_status'] == 'employed'
         assert applicant['sex'] == 'male'
         assert applicant['marital_status'] == 'single'
+
+def test__api_get_applicants_no_lazy_loads(api_test_client, api_test_admin, query_counter):
+    """
+    Positive test: Verify that serializing the applicants list does not lazily load any relationship,
+    and that the request stays within a fixed number of queries regardless of page size.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    # Step 2: Ensure there is at least one applicant with household members to serialize
+    applicant_data = {
+        "name": "Lazy Load Guard",
+        "employment_status": "employed",
+        "sex": "F",
+        "date_of_birth": "1980-03-01T00:00:00",
+        "marital_status": "married",
+        "household_members": [
+            {"name": "Child Guard", "relation": "child", "date_of_birth": "2012-07-01T00:00:00", "employment_status": "unemployed", "sex": "M"}
+        ]
+    }
+    response = api_test_client.post('/api/applicants', json=applicant_data, headers={'Authorization': f'Bearer {access_token}'})
+    assert response.status_code == 201
+
+    # Step 3: Forbid lazy loads on every applicants query (explicit selectinload options still apply)
+    def add_raiseload(orm_execute_state):
+        if orm_execute_state.is_select and not orm_execute_state.is_relationship_load and not orm_execute_state.is_column_load:
+            orm_execute_state.statement = orm_execute_state.statement.options(raiseload('*'))
+
+    # Step 4: Count the statements sent to the API database
+    event.listen(Session, "do_orm_execute", add_raiseload)
+    try:
+        with query_counter(api_engine) as statements:
+            response = api_test_client.get('/api/applicants?page=1&page_size=50' ,headers={'Authorization': f'Bearer {access_token}'})
+    finally:
+        event.remove(Session, "do_orm_execute", add_raiseload)
+
+    assert response.status_code == 200  # A lazy load would raise InvalidRequestError and surface as a 500
+    assert len(response.get_json()['data']) >= 1
+    assert len(statements) <= 3  # ETag fingerprint, page query with windowed total count, household members SELECT ... IN
+
+def test__api_get_applicants_conditional_request(api_test_client, api_test_admin):
+    """
+    Positive test: Verify that the API returns an ETag, answers 304 when it still matches, and changes it after a new applicant is created.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    # Step 2: First request returns the data and an ETag
+    response = api_test_client.get('/api/applicants?page=1&page_size=5', headers=headers)
+    etag = response.headers.get('ETag')
+    assert response.status_code == 200
+    assert etag
+
+    # Step 3: Re-polling with the ETag returns 304 without a body
+    response = api_test_client.get('/api/applicants?page=1&page_size=5', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+    # Step 4: A different page has a different ETag
+    response = api_test_client.get('/api/applicants?page=2&page_size=5', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+
+    # Step 5: Creating an applicant invalidates the ETag
+    applicant_data = {
+        "name": "ETag Changer",
+        "employment_status": "unemployed",
+        "sex": "M",
+        "date_of_birth": "1975-09-09T00:00:00",
+        "marital_status": "single",
+        "household_members": []
+    }
+    response = api_test_client.post('/api/applicants', json=applicant_data, headers=headers)
+    assert response.status_code == 201
+
+    response = api_test_client.get('/api/applicants?page=1&page_size=5', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers.get('ETag') != etag
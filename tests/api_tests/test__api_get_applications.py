@@ -2,6 +2,8 @@
 
 
 from sqlalchemy.exc import SQLAlchemyError
+from api import api_engine
+from config import Config
 from tests.conftest import helper 
 
 
@@ -68,7 +70,7 @@ def test_get_applications_sqlalchemy_error(api_test_client, api_test_admin, mock
 
     assert response.status_code == 500
     assert 'error' in data
-    assert data['error'] == "An unexpected error occurred"
+    assert data['error'] == "A database error occurred."  # Answered by the app-level handler
 
 
 
@@ -116,3 +118,147 @@ def test_get_applications_invalid_pagination(api_test_client, api_test_admin):
     assert response.status_code == 400
     assert 'error' in data
     assert data['error'] == "Page number must be greater than 0."
+
+
+def test_get_applications_conditional_request(api_test_client, api_test_admin):
+    """
+    Positive test: Verify that the API returns an ETag, answers 304 when it still matches, and changes it when an embedded applicant changes.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    # Step 2: First request returns the data and an ETag
+    response = api_test_client.get('/api/applications?page=1&page_size=5', headers=headers)
+    etag = response.headers.get('ETag')
+    assert response.status_code == 200
+    assert etag
+
+    # Step 3: Re-polling with the ETag returns 304 without a body
+    response = api_test_client.get('/api/applications?page=1&page_size=5', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+    # Step 4: A different page has a different ETag
+    response = api_test_client.get('/api/applications?page=2&page_size=5', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+
+    # Step 5: Listed applications embed their applicant, so creating an applicant invalidates the ETag
+    applicant_data = {
+        "name": "Applications ETag Changer",
+        "employment_status": "employed",
+        "sex": "F",
+        "date_of_birth": "1985-02-02T00:00:00",
+        "marital_status": "single",
+        "household_members": []
+    }
+    response = api_test_client.post('/api/applicants', json=applicant_data, headers=headers)
+    assert response.status_code == 201
+
+    response = api_test_client.get('/api/applications?page=1&page_size=5', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers.get('ETag') != etag
+
+
+def test_get_applications_page_size_too_large(api_test_client, api_test_admin):
+    """
+    Negative test: Verify that the API rejects a page size above the configured maximum before querying.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    response = api_test_client.get(f'/api/applications?page=1&page_size={Config.MAX_PAGE_SIZE + 1}', headers={'Authorization': f'Bearer {access_token}'})
+    data = response.get_json()
+
+    assert response.status_code == 400
+    assert data['error'] == f"Page size must not exceed {Config.MAX_PAGE_SIZE}."
+
+    # The cursor mode's limit is bounded the same way
+    response = api_test_client.get(f'/api/applications?limit={Config.MAX_PAGE_SIZE + 1}', headers={'Authorization': f'Bearer {access_token}'})
+    assert response.status_code == 400
+
+
+def test_get_applications_non_integer_pagination(api_test_client, api_test_admin):
+    """
+    Negative test: Verify that the API returns a 400 error for non-integer pagination parameters.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    response = api_test_client.get('/api/applications?page=abc&page_size=10', headers={'Authorization': f'Bearer {access_token}'})
+    data = response.get_json()
+
+    assert response.status_code == 400
+    assert data['error'] == "Page number and page size must be integers."
+
+
+def test_get_applications_streamed_page_matches_buffered(api_test_client, api_test_admin, monkeypatch):
+    """
+    Positive test: Verify that a large page streamed while its rows are fetched is byte-for-byte the buffered response.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    # Step 2: A page size at the streaming threshold is streamed
+    response = api_test_client.get('/api/applications?page=1&page_size=60', headers=headers)
+    assert response.status_code == 200
+    assert 'Content-Length' not in response.headers  # Streamed bodies have no length up front
+    streamed_body = response.get_data()
+    data = response.get_json()
+    assert data['pagination']['current_page'] == 1
+    assert data['pagination']['page_size'] == 60
+    assert 'ETag' in response.headers
+
+    # Step 3: The same page built in one go
+    monkeypatch.setattr('api.routes.applications._STREAM_MIN_PAGE_SIZE', Config.MAX_PAGE_SIZE + 1)
+    response = api_test_client.get('/api/applications?page=1&page_size=60', headers=headers)
+    assert response.status_code == 200
+    assert 'Content-Length' in response.headers
+    assert response.get_data() == streamed_body
+
+
+def test_get_applications_page_past_the_end(api_test_client, api_test_admin, query_counter):
+    """
+    Positive test: Verify that a page past the last one is answered with an empty page and the true total count, 
+    from the ETag fingerprint alone.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    response = api_test_client.get('/api/applications?page=1&page_size=5', headers=headers)
+    total_count = response.get_json()['pagination']['total_count']
+
+    # Step 2: Request a page far past the end, counting the statements sent to the API database
+    with query_counter(api_engine) as statements:
+        response = api_test_client.get('/api/applications?page=100000&page_size=5', headers=headers)
+
+    data = response.get_json()
+    assert response.status_code == 200
+    assert data['data'] == []
+    assert data['pagination']['current_page'] == 100000
+    assert data['pagination']['total_count'] == total_count
+    assert data['pagination']['total_pages'] == -(-total_count // 5)
+    assert len(statements) == 1  # Only the version fingerprint
+
+
+def test_get_applications_cursor_mode_skips_fingerprint(api_test_client, api_test_admin, monkeypatch):
+    """
+    Positive test: Verify that a cursor page is served without reading the version fingerprint, and carries no ETag.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    def fail_version(self):
+        raise AssertionError("The cursor mode must not read the applications fingerprint")
+
+    monkeypatch.setattr('bl.services.application_service.ApplicationService.get_applications_version', fail_version)
+
+    response = api_test_client.get('/api/applications?limit=5', headers={'Authorization': f'Bearer {access_token}'})
+    data = response.get_json()
+
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+    assert len(data['data']) <= 5
+    assert 'next_cursor' in data['pagination']
@@ -3,6 +3,10 @@
 
 
 import pytest
+from sqlalchemy.exc import SQLAlchemyError
+from bl.services.scheme_service import SchemeService
+from api import api_engine
+from api.routes.schemes import _valid_schemes_cache, SchemeSnapshot
 from tests.conftest import helper
 
 # ====================== Tests for get_schemes Endpoint ======================
@@ -50,6 +54,69 @@ def test_api_get_schemes_invalid_page_parameter(api_test_client, api_test_admin)
     assert data['error'] == "Page number must be greater than 0."
 
 
+def test_api_get_schemes_database_error(api_test_client, api_test_admin, monkeypatch):
+    """
+    Negative test: Verify that a database error is answered by the app-level handler with a 500 error, without the driver's message.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    def fail(*args, **kwargs):
+        raise SQLAlchemyError("SELECT secret FROM Schemes")
+
+    monkeypatch.setattr(SchemeService, 'get_schemes_version', fail)
+
+    response = api_test_client.get('/api/schemes', headers={'Authorization': f'Bearer {access_token}'})
+    assert response.status_code == 500
+    assert response.get_json() == {'error': 'A database error occurred.'}
+
+
+def test_api_get_schemes_conditional_request(api_test_client, api_test_admin):
+    """
+    Positive test: Verify that the API returns an ETag for the schemes list and answers 304 when it still matches.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    # Step 2: First request returns the data and an ETag
+    response = api_test_client.get('/api/schemes?page=1&per_page=5', headers=headers)
+    etag = response.headers.get('ETag')
+    assert response.status_code == 200
+    assert etag
+
+    # Step 3: Re-polling with the ETag returns 304 without a body
+    response = api_test_client.get('/api/schemes?page=1&per_page=5', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+    # Step 4: A different listing has a different ETag
+    response = api_test_client.get('/api/schemes?page=1&per_page=5&fetch_valid_schemes=false', headers={**headers, 'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers.get('ETag') != etag
+
+
+def test_api_get_schemes_repeated_page_is_served_from_cache(api_test_client, api_test_admin, query_counter):
+    """
+    Positive test: Verify that a schemes page requested again (without If-None-Match) is served from the cached body without re-querying the page.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    # Step 2: Request the same page twice, counting the statements sent to the API database
+    with query_counter(api_engine) as statements:
+        first = api_test_client.get('/api/schemes?page=1&per_page=3&fetch_valid_schemes=false', headers=headers)
+        first_statements = len(statements)
+        second = api_test_client.get('/api/schemes?page=1&per_page=3&fetch_valid_schemes=false', headers=headers)
+        second_statements = len(statements) - first_statements
+
+    assert first.status_code == second.status_code == 200
+    assert first.data == second.data
+    assert first.headers.get('ETag') == second.headers.get('ETag')
+    assert second_statements < first_statements  # Only the version fingerprint runs on a cache hit
+
+
 
 # ====================== Tests for get_eligible_schemes Endpoint ======================
 
@@ -112,6 +179,19 @@ def test_api_get_eligible_schemes_invalid_applicant_id_format(api_test_client, a
     assert 'error' in data
     assert data['error'] == "Invalid applicant id format"
 
+def test_api_get_eligible_schemes_negative_applicant_id(api_test_client, api_test_admin):
+    """
+    Negative test: Verify that the API returns a 400 error for a negative applicant ID.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+
+    response = api_test_client.get('/api/schemes/eligible?applicant=-1', headers={'Authorization': f'Bearer {access_token}'})
+    data = response.get_json()
+
+    assert response.status_code == 400
+    assert data['error'] == "Invalid applicant id format"
+
 def test_api_get_eligible_schemes_applicant_not_found(api_test_client, api_test_admin):
     """
     Negative test: Verify that the API returns a 404 error if the applicant is not found.
@@ -128,3 +208,110 @@ def test_api_get_eligible_schemes_applicant_not_found(api_test_client, api_test_
 
     assert response.status_code == 404
     assert 'error' in data
+
+def test_api_get_eligible_schemes_repeated_check_is_cached(api_test_client, api_test_admin, query_counter):
+    """
+    Positive test: Verify that repeating an eligibility check for an unchanged applicant returns the same result without re-running the checks.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    # Step 2: Create an applicant to check
+    applicant_data = {
+        "name": "Cached Eligibility",
+        "employment_status": "unemployed",
+        "sex": "F",
+        "date_of_birth": "1950-03-01T00:00:00",
+        "marital_status": "widowed",
+        "household_members": []
+    }
+    response = api_test_client.post('/api/applicants', json=applicant_data, headers=headers)
+    assert response.status_code == 201
+    applicant_id = response.get_json()['data']['id']
+
+    # Step 3: Run the same check twice, counting the statements sent to the API database
+    _valid_schemes_cache.clear()  # So that the first check loads the schemes
+    with query_counter(api_engine) as statements:
+        first = api_test_client.get(f'/api/schemes/eligible?applicant={applicant_id}', headers=headers)
+        first_statements = len(statements)
+        second = api_test_client.get(f'/api/schemes/eligible?applicant={applicant_id}', headers=headers)
+        second_statements = len(statements) - first_statements
+
+    assert first.status_code == second.status_code == 200
+    assert first.get_json() == second.get_json()
+    assert second_statements < first_statements  # The schemes listing is skipped on a cache hit
+
+
+def test_api_get_eligible_schemes_query_count(api_test_client, api_test_admin, query_counter):
+    """
+    Positive test: Verify that an eligibility check runs a fixed number of statements whatever the household size and number of schemes: 
+    the applicant with their household (joined), the valid schemes' fingerprint, and the valid schemes.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    # Step 2: Create an applicant with a household to check
+    applicant_data = {
+        "name": "Eligibility Query Count",
+        "employment_status": "unemployed",
+        "sex": "F",
+        "date_of_birth": "1980-03-01T00:00:00",
+        "marital_status": "married",
+        "household_members": [
+            {"name": "Child One", "relation": "child", "date_of_birth": "2015-01-01T00:00:00", "employment_status": "unemployed", "sex": "M"},
+            {"name": "Child Two", "relation": "child", "date_of_birth": "2017-01-01T00:00:00", "employment_status": "unemployed", "sex": "F"}
+        ]
+    }
+    response = api_test_client.post('/api/applicants', json=applicant_data, headers=headers)
+    assert response.status_code == 201
+    applicant_id = response.get_json()['data']['id']
+
+    # Step 3: Check eligibility, counting the statements sent to the API database
+    with query_counter(api_engine) as statements:
+        response = api_test_client.get(f'/api/schemes/eligible?applicant={applicant_id}', headers=headers)
+
+    assert response.status_code == 200
+    assert len(statements) <= 3
+
+
+def test_api_get_eligible_schemes_reuses_valid_schemes_snapshot(api_test_client, api_test_admin, query_counter, monkeypatch):
+    """
+    Positive test: Verify that checking a second applicant against unchanged valid schemes reuses the schemes loaded by the first check.
+    """
+    # Step 1: Authenticate to get JWT token
+    access_token = helper.get_JWT_via_user_login(api_test_client, api_test_admin)
+    headers = {'Authorization': f'Bearer {access_token}'}
+
+    # Step 2: Create two applicants to check
+    applicant_ids = []
+    for name in ("Snapshot First", "Snapshot Second"):
+        applicant_data = {
+            "name": name,
+            "employment_status": "unemployed",
+            "sex": "M",
+            "date_of_birth": "1955-03-01T00:00:00",
+            "marital_status": "single",
+            "household_members": []
+        }
+        response = api_test_client.post('/api/applicants', json=applicant_data, headers=headers)
+        assert response.status_code == 201
+        applicant_ids.append(response.get_json()['data']['id'])
+
+    # Step 3: Check both applicants, counting the statements sent to the API database and keeping the snapshots taken
+    _valid_schemes_cache.clear()
+    snapshots = []
+    set_snapshot = _valid_schemes_cache.set
+    monkeypatch.setattr(_valid_schemes_cache, 'set', lambda key, value: (snapshots.append(value), set_snapshot(key, value)))
+    with query_counter(api_engine) as statements:
+        first = api_test_client.get(f'/api/schemes/eligible?applicant={applicant_ids[0]}', headers=headers)
+        first_statements = len(statements)
+        second = api_test_client.get(f'/api/schemes/eligible?applicant={applicant_ids[1]}', headers=headers)
+        second_statements = len(statements) - first_statements
+
+    assert first.status_code == second.status_code == 200
+    assert len(first.get_json()['data']['eligibility_results']) == len(second.get_json()['data']['eligibility_results'])
+    assert second_statements == first_statements - 1  # The schemes query is skipped
+    assert len(snapshots) == 1
+    assert all(type(scheme) is SchemeSnapshot for scheme in snapshots[0])  # Plain data, not ORM instances bound to the first request's session
@@ -0,0 +1,29 @@
+# Copyright (c) 2024 by Jonathan AW
+# tests/api_tests/test__api_health.py
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+
+def test_db_health_check(api_test_client):
+    """
+    Positive test: The database health check runs SELECT 1 through the connection pool without authentication.
+    """
+    response = api_test_client.get('/health/db')
+    data = response.get_json()
+    assert response.status_code == 200
+    assert data == {'status': 'ok'}  # Pool internals are not exposed to unauthenticated callers
+
+
+def test_db_health_check_database_error(api_test_client, monkeypatch):
+    """
+    Negative test: A failing database check answers 503 with the status only, without the driver's error message.
+    """
+    def fail(self, *args, **kwargs):
+        raise SQLAlchemyError("connection refused to secret-host")
+
+    monkeypatch.setattr(Session, 'execute', fail)
+
+    response = api_test_client.get('/health/db')
+    assert response.status_code == 503
+    assert response.get_json() == {'status': 'unavailable'}
@@ -0,0 +1,18 @@
+# Copyright (c) 2024 by Jonathan AW
+# tests/api_tests/test__api_openapi.py
+
+
+def test_openapi_yaml_conditional_request(api_test_client):
+    """
+    Positive test: The OpenAPI specification is served with caching headers and answers 304 when the client's copy is current.
+    """
+    response = api_test_client.get('/openapi.yaml')
+    etag = response.headers.get('ETag')
+    assert response.status_code == 200
+    assert response.get_data().startswith(b'openapi:')
+    assert etag
+    assert 'max-age=300' in response.headers['Cache-Control']
+
+    response = api_test_client.get('/openapi.yaml', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.get_data() == b''
@@ -172,3 +172,17 @@ def test__neg_failed_create_administrator_due_to_username_conflict(crud_operatio
     with pytest.raises(IntegrityError):
         admin_service.create_administrator(admin_data)
 
+
+def test_successful_login_without_prior_failures_is_a_single_query(crud_operations, query_counter):
+    """
+    Test that a successful login of an account with no failed attempts to reset only reads the administrator.
+    """
+    admin_service = AdministratorService(crud_operations)
+    new_admin = admin_service.create_administrator({"username": "admin_single_query", "password_hash": "my_password"})
+
+    engine = crud_operations.db_session.get_bind()
+    with query_counter(engine) as statements:
+        admin, mesg = admin_service.verify_login_credentials(new_admin.username, "my_password")
+
+    assert admin is not None
+    assert len(statements) == 1  # SELECT of the administrator; there are no failure counters to reset
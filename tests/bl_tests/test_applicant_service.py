@@ -7,6 +7,7 @@ Priority: High (core service, crucial for managing applicants and householdmembe
 """
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError, NoResultFound, DataError
 from dal.models import Applicant
 from datetime import datetime
@@ -448,6 +449,85 @@ def test_get_all_applicants_pagination_beyond_range(applicant_service, multiple_
     assert len(applicants) == 0  # No applicants should be returned for an out-of-range page
     assert total_count == len(multiple_applicants)  # Total count remains the same
 
+def test_get_all_applicants_rows_matches_orm_listing(applicant_service, crud_operations, multiple_applicants):
+    """
+    Test that the read-only row listing returns the same applicants, columns and household members as the ORM listing.
+    """
+    applicant = crud_operations.get_applicants_by_filters({"name": "Bob Johnson"})[0]
+    applicant_service.create_household_member(applicant.id, {"name": "Bob Junior", "relation": "child", "date_of_birth": datetime(2015, 6, 15)})
+
+    rows, rows_total_count = applicant_service.get_all_applicants_rows(page=1, page_size=3, sort_by='name', sort_order='desc', filters={"marital_status": "married"})
+    applicants, total_count = applicant_service.get_all_applicants(page=1, page_size=3, sort_by='name', sort_order='desc', filters={"marital_status": "married"})
+
+    assert rows_total_count == total_count == 2
+    assert [row['name'] for row in rows] == ["Eve Green", "Bob Johnson"]
+    for row, applicant in zip(rows, applicants):
+        assert row['date_of_birth'] == applicant.date_of_birth
+        assert row['created_by_admin_id'] == applicant.created_by_admin_id
+        assert [member['name'] for member in row['household_members']] == [member.name for member in applicant.household_members]
+    assert [member['name'] for member in rows[1]['household_members']] == ["Bob Junior"]
+
+def test_get_all_applicants_rows_total_count(applicant_service, multiple_applicants):
+    """
+    Test that the row listing reports the total count on a partial page, on a page beyond the range and with no matches.
+    """
+    rows, total_count = applicant_service.get_all_applicants_rows(page=3, page_size=2)
+    assert len(rows) == 1
+    assert total_count == len(multiple_applicants)
+    assert '_total' not in rows[0]
+
+    rows, total_count = applicant_service.get_all_applicants_rows(page=10, page_size=2)
+    assert rows == []
+    assert total_count == len(multiple_applicants)
+
+    rows, total_count = applicant_service.get_all_applicants_rows(page=1, page_size=2, filters={"marital_status": "widowed"})
+    assert rows == []
+    assert total_count == 0
+
+def test_get_all_applicants_household_members_loaded_without_n_plus_1(applicant_service, crud_operations, multiple_applicants, query_counter):
+    """
+    Test that reading the household members of a page of applicants does not issue one query per applicant.
+    """
+    engine = crud_operations.db_session.get_bind()
+    with query_counter(engine) as statements:
+        applicants, total_count = applicant_service.get_all_applicants(page=1, page_size=5)
+        for applicant in applicants:
+            list(applicant.household_members)  # Must already be loaded
+
+    assert len(applicants) == 5
+    assert len(statements) <= 3  # Page query, household members SELECT ... IN, count query
+
+
+def test_check_schemes_eligibility_without_lazy_loads(applicant_service, crud_operations, scheme_manager, test_administrator, 
+                                                     retrenchment_assistance_scheme, senior_citizen_assistance_scheme, query_counter):
+    """
+    Test that checking an applicant against every scheme runs a single schemes query: the household members are joined-loaded with 
+    the applicant (Applicant.household_members is lazy='joined'), so the per-scheme checks never go back to the database.
+    """
+    applicant = applicant_service.create_applicant({
+        "name": "Eager Household",
+        "employment_status": "unemployed",
+        "sex": "F",
+        "date_of_birth": datetime(1980, 3, 1),
+        "marital_status": "married",
+        "marriage_date": datetime.now() - relativedelta(months=3),
+        "employment_status_change_date": datetime.now() - relativedelta(months=1),
+        "created_by_admin_id": test_administrator.id
+    }, household_members_data=[
+        {"name": "Child Eager", "relation": "child", "date_of_birth": datetime.now() - relativedelta(years=8), "employment_status": "unemployed", "sex": "M"}
+    ])
+    crud_operations.db_session.expunge_all()  # Start from an empty identity map, as a new request would
+
+    applicant = applicant_service.get_applicant_by_id(applicant.id)
+    engine = crud_operations.db_session.get_bind()
+    with query_counter(engine) as statements:
+        eligibility_results, eligible_schemes = scheme_manager.check_schemes_eligibility_for_applicant({}, True, applicant)
+        household_members = list(applicant.household_members)  # Must already be loaded
+
+    assert len(eligibility_results) >= 2
+    assert len(household_members) == 1
+    assert len(statements) == 1  # The schemes query; the household was loaded with the applicant
+
 
 # Updated negative test cases in test_applicant_service.py
 
@@ -594,3 +674,79 @@ def test_get_all_applicants_combined_filters(applicant_service: ApplicantService
     filters = {"employment_status": "employed", "marital_status": "married"}
     applicants, total_count = applicant_service.get_all_applicants(page=1, page_size=20, filters=filters)
     assert all(applicant.employment_status == "employed" and applicant.marital_status == "married" for applicant in applicants)
+
+
+def test_create_applicants_in_one_batch(applicant_service, crud_operations, test_administrator):
+    """
+    Test creating several applicants with household members in one batch, committed once.
+    """
+    applicants_data = [{
+        "name": f"Batch Applicant {index}",
+        "employment_status": "employed",
+        "sex": "F",
+        "date_of_birth": datetime(1980 + index, 1, 1),
+        "marital_status": "single",
+        "created_by_admin_id": test_administrator.id
+    } for index in range(3)]
+    # Rows with different keys are inserted in the same batch
+    applicants_data[1].update({"marital_status": "married", "marriage_date": datetime(2020, 6, 1)})
+    household_members_data = [
+        [{"name": f"Batch Child {index}", "relation": "child", "date_of_birth": datetime(2010, 5, 1), "employment_status": "unemployed", "sex": "F"},
+         {"name": f"Batch Parent {index}", "relation": "parent", "date_of_birth": datetime(1950, 8, 20), "employment_status": "unemployed", "sex": "M"}]
+        for index in range(3)
+    ]
+
+    commits = []
+
+    def count_commits(session):
+        commits.append(session)
+
+    event.listen(crud_operations.db_session, "after_commit", count_commits)
+    try:
+        applicant_ids = applicant_service.create_applicants(applicants_data, household_members_data)
+    finally:
+        event.remove(crud_operations.db_session, "after_commit", count_commits)
+
+    applicants = [crud_operations.get_applicant(applicant_id) for applicant_id in applicant_ids]
+    assert [applicant.name for applicant in applicants] == [data["name"] for data in applicants_data]
+    for index, applicant in enumerate(applicants):
+        assert sorted(member.name for member in applicant.household_members) == [f"Batch Child {index}", f"Batch Parent {index}"]
+    assert applicants[1].marriage_date == datetime(2020, 6, 1) and applicants[0].marriage_date is None
+    assert len(commits) == 1  # The whole batch is written in one transaction
+
+
+def test_create_applicants_validates_before_writing(applicant_service, crud_operations, test_administrator):
+    """
+    Test that a batch with one invalid applicant raises before any applicant of the batch is written.
+    """
+    applicants_data = [{
+        "name": name,
+        "employment_status": "employed",
+        "sex": "M",
+        "date_of_birth": datetime(1990, 1, 1),
+        "marital_status": "single",
+        "created_by_admin_id": test_administrator.id
+    } for name in ("Batch Valid Applicant", "")]  # The second name is invalid
+
+    with pytest.raises(InvalidApplicantDataException):
+        applicant_service.create_applicants(applicants_data, [[], []])
+
+    assert crud_operations.get_applicants_by_filters({"name": "Batch Valid Applicant"}) == []
+
+
+def test_iter_applicants_with_household(applicant_service: ApplicantService, crud_operations, setup_applicants, query_counter):
+    """
+    Test that every applicant is retrieved with their household members in batches of two queries each, including across commits.
+    """
+    engine = crud_operations.db_session.get_bind()
+    crud_operations.db_session.expunge_all()
+    batches = []
+    with query_counter(engine) as queries:
+        for batch in applicant_service.iter_applicants_with_household(batch_size=8):
+            batches.append([(applicant.id, len(applicant.household_members)) for applicant in batch])
+            crud_operations.db_session.commit()  # The caller may commit between batches
+
+    assert [len(batch) for batch in batches] == [8, 8, 4]
+    assert [applicant_id for batch in batches for applicant_id, _ in batch] == sorted(setup_applicants)
+    assert sum(household_size for batch in batches for _, household_size in batch) > 0
+    assert len(queries) == 2 * len(batches)  # Applicants, then all their household members, per batch
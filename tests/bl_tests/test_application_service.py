@@ -7,6 +7,7 @@ from exceptions import ApplicantNotFoundException, SchemeNotFoundException, Inva
 from bl.factories.scheme_eligibility_checker_factory import SchemeEligibilityCheckerFactory
 from bl.schemes.schemes_manager import SchemesManager
 from dal.crud_operations import CRUDOperations
+from dal.custom_serializer import serialize
 
 def test_create_application_invalid_applicant(application_service, crud_operations, test_administrator, retrenchment_assistance_scheme):
     """
@@ -181,3 +182,86 @@ def test_create_application_rejected_or_pending(test_administrator, retrenchment
     assert application.status == "approved"
     assert application.eligibility_verdict == "Eligible"
     assert application.awarded_benefits == {"benefit1": "value1"}
+
+
+def test_create_applications_for_schemes(test_administrator, retrenchment_assistance_scheme, senior_citizen_assistance_scheme, test_applicant, 
+                                         application_service: ApplicationService, scheme_eligibility_checker_factory):
+    """
+    Test that applications for several schemes are created in one batch, and that schemes already approved for the applicant are skipped.
+    """
+    schemes = [retrenchment_assistance_scheme, senior_citizen_assistance_scheme]
+    applications, skipped = application_service.create_applications_for_schemes(test_applicant.id, schemes, test_administrator.id, scheme_eligibility_checker_factory)
+
+    assert len(applications) + len(skipped) == len(schemes)
+    for application in applications:
+        assert application.id is not None
+        assert application.applicant_id == test_applicant.id
+        assert application.status in ("approved", "rejected")
+        assert application_service.get_application_by_id(application.id).scheme_id == application.scheme_id
+
+    # A second batch skips the schemes the first one approved, as create_application would refuse them
+    approved_scheme_ids = {application.scheme_id for application in applications if application.status == "approved"}
+    applications, skipped = application_service.create_applications_for_schemes(test_applicant.id, schemes, test_administrator.id, scheme_eligibility_checker_factory)
+    assert approved_scheme_ids <= set(skipped)
+    assert {application.scheme_id for application in applications}.isdisjoint(approved_scheme_ids)
+
+
+def test_create_applications_for_schemes_invalid_applicant(test_administrator, retrenchment_assistance_scheme, application_service: ApplicationService, 
+                                                           scheme_eligibility_checker_factory):
+    """
+    Test that a batch for a non-existent applicant raises ApplicantNotFoundException.
+    """
+    with pytest.raises(ApplicantNotFoundException):
+        application_service.create_applications_for_schemes(9999, [retrenchment_assistance_scheme], test_administrator.id, scheme_eligibility_checker_factory)
+
+
+def test_create_applications_for_applicants(test_administrator, retrenchment_assistance_scheme, senior_citizen_assistance_scheme, setup_applicants, 
+                                            crud_operations, application_service: ApplicationService, scheme_eligibility_checker_factory):
+    """
+    Test that applications of several applicants for several schemes are created in one batch, and that approved pairs are skipped on a rerun.
+    """
+    applicants = [crud_operations.get_applicant(applicant_id) for applicant_id in setup_applicants[:5]]
+    schemes = [retrenchment_assistance_scheme, senior_citizen_assistance_scheme]
+    applications, skipped = application_service.create_applications_for_applicants(applicants, schemes, test_administrator.id, scheme_eligibility_checker_factory)
+
+    created_pairs = {(application.applicant_id, application.scheme_id) for application in applications}
+    assert len(applications) + len(skipped) == len(applicants) * len(schemes)
+    assert created_pairs | set(skipped) == {(applicant.id, scheme.id) for applicant in applicants for scheme in schemes}
+    assert all(application.id is not None for application in applications)
+
+    approved_pairs = {(application.applicant_id, application.scheme_id) for application in applications if application.status == "approved"}
+    applications, skipped = application_service.create_applications_for_applicants(applicants, schemes, test_administrator.id, scheme_eligibility_checker_factory)
+    assert approved_pairs <= set(skipped)
+    assert {(application.applicant_id, application.scheme_id) for application in applications}.isdisjoint(approved_pairs)
+
+
+def test_create_applications_for_pairs(test_administrator, retrenchment_assistance_scheme, senior_citizen_assistance_scheme, setup_applicants, 
+                                       crud_operations, application_service: ApplicationService, scheme_eligibility_checker_factory, query_counter):
+    """
+    Test that applications are created for exactly the requested (applicant, scheme) pairs, in one batch, and are returned loaded: 
+    serializing them after the commit does not refresh each application.
+    """
+    pairs = [(setup_applicants[0], retrenchment_assistance_scheme.id), (setup_applicants[1], senior_citizen_assistance_scheme.id), 
+             (setup_applicants[2], retrenchment_assistance_scheme.id)]
+    applications, skipped = application_service.create_applications_for_pairs(pairs, test_administrator.id, scheme_eligibility_checker_factory)
+
+    with query_counter(crud_operations.db_session.get_bind()) as statements:
+        serialized = serialize(applications)
+
+    assert skipped == {}
+    assert sorted((application['applicant_id'], application['scheme_id']) for application in serialized) == sorted(pairs)
+    assert all(application['status'] in ("approved", "rejected") for application in serialized)
+    assert all(application['applicant'] is not None and application['scheme'] is not None for application in serialized)
+    assert statements == []
+
+
+def test_create_applications_for_pairs_invalid_scheme(test_administrator, retrenchment_assistance_scheme, setup_applicants, crud_operations, 
+                                                      application_service: ApplicationService, scheme_eligibility_checker_factory):
+    """
+    Test that a bulk request with an unknown scheme raises SchemeNotFoundException and creates nothing.
+    """
+    pairs = [(setup_applicants[0], retrenchment_assistance_scheme.id), (setup_applicants[1], 9999)]
+    with pytest.raises(SchemeNotFoundException):
+        application_service.create_applications_for_pairs(pairs, test_administrator.id, scheme_eligibility_checker_factory)
+
+    assert crud_operations.get_applications_by_filters({"applicant_id": setup_applicants[0]}) == []
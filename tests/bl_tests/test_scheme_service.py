@@ -165,6 +165,25 @@ def test_get_schemes_by_filters(crud_operations, retrenchment_assistance_scheme)
     assert rec_counts > 0
     assert schemes[0].name == retrenchment_assistance_scheme.name
 
+def test_create_schemes(crud_operations):
+    """
+    Test creating several schemes in one batch, and that the IDs are returned in the order of the data.
+    """
+    schemes_data = [{
+        "name": f"Batch Scheme {index}",
+        "description": f"Batch scheme number {index}.",
+        "eligibility_criteria": {"age_threshold": 60 + index},
+        "benefits": {"cash_assistance": {"disbursment_amount": 100 * (index + 1), "disbursment_frequency": "One-Off", 
+                                         "disbursment_duration_months": None, "description": "Cash assistance."}},
+        "validity_start_date": datetime(2024, 1, 1),
+        "validity_end_date": None
+    } for index in range(3)]
+    scheme_service = SchemeService(crud_operations)
+    scheme_ids = scheme_service.create_schemes(schemes_data)
+
+    assert [scheme_service.get_scheme_by_id(scheme_id).name for scheme_id in scheme_ids] == [data["name"] for data in schemes_data]
+    assert scheme_service.get_scheme_by_id(scheme_ids[2]).eligibility_criteria == {"age_threshold": 62}
+
 # Negative Test Cases
 
 def test__neg_create_scheme_invalid_data(crud_operations):
@@ -220,3 +239,32 @@ def test__neg_get_schemes_with_invalid_filters(crud_operations):
     with pytest.raises(AttributeError):
         schemes = scheme_service.get_schemes_by_filters({"invalid_field": "invalid_value"}, fetch_valid_schemes=True)
     # assert len(schemes) == 0  # Expect no schemes to be returned
+
+def test_get_existing_scheme_names(crud_operations, retrenchment_assistance_scheme):
+    """
+    Test finding which of several scheme names already exist.
+    """
+    scheme_service = SchemeService(crud_operations)
+    names = [retrenchment_assistance_scheme.name, "Unprovisioned Scheme"]
+
+    assert scheme_service.get_existing_scheme_names(names) == {retrenchment_assistance_scheme.name}
+    assert scheme_service.get_existing_scheme_names([]) == set()
+
+def test__neg_create_schemes_invalid_data(crud_operations):
+    """
+    Test that a batch with one invalid scheme raises before any scheme of the batch is written.
+    """
+    valid_scheme_data = {
+        "name": "Valid Batch Scheme",
+        "description": "A valid scheme.",
+        "eligibility_criteria": {"age_threshold": 65},
+        "benefits": {},
+        "validity_start_date": datetime(2024, 1, 1),
+        "validity_end_date": None
+    }
+    scheme_service = SchemeService(crud_operations)
+
+    with pytest.raises(InvalidSchemeDataException):
+        scheme_service.create_schemes([valid_scheme_data, dict(valid_scheme_data, name="")])
+
+    assert scheme_service.get_existing_scheme_names(["Valid Batch Scheme"]) == set()
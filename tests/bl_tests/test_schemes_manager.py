@@ -4,5 +4,44 @@
 import pytest
 from bl.schemes.schemes_manager import SchemesManager
 from exceptions import SchemeNotFoundException
+from bl.factories.scheme_eligibility_checker_factory import SchemeEligibilityCheckerFactory
+from bl.schemes.default_eligibility import DefaultEligibility
+from dal.models import Scheme
 
 
+def test_eligibility_registry_is_shared():
+    """
+    Test that the eligibility strategy registry is built once at class level and shared by every factory, whatever its session.
+    """
+    registry = SchemeEligibilityCheckerFactory.eligibility_definitions_mapping
+    assert len(registry) == 4
+
+    first, second = SchemeEligibilityCheckerFactory(), SchemeEligibilityCheckerFactory(db_session=object())
+    assert first.eligibility_definitions_mapping is second.eligibility_definitions_mapping is registry
+
+    for scheme_name, strategy_class in registry.items():
+        assert isinstance(first.get_eligibility_definition(Scheme(name=scheme_name)), strategy_class)
+    assert isinstance(second.get_eligibility_definition(Scheme(name="Unregistered Scheme")), DefaultEligibility)
+
+
+def test_check_scheme_eligibility_for_applicants_loads_checker_once(crud_operations, scheme_eligibility_checker_factory, retrenchment_assistance_scheme, 
+                                                                    setup_applicants, monkeypatch):
+    """
+    Test that checking several applicants against a scheme loads the scheme's eligibility checker once, with the same verdicts as one-by-one checks.
+    """
+    applicants = [crud_operations.get_applicant(applicant_id) for applicant_id in setup_applicants[:5]]
+    scheme_manager = SchemesManager(crud_operations, scheme_eligibility_checker_factory)
+    expected = [scheme_manager.check_scheme_eligibility_for_applicant(retrenchment_assistance_scheme, applicant).report for applicant in applicants]
+
+    loads = []
+    load_scheme_eligibility_checker = scheme_eligibility_checker_factory.load_scheme_eligibility_checker
+
+    def counting_load(scheme):
+        loads.append(scheme.id)
+        return load_scheme_eligibility_checker(scheme)
+
+    monkeypatch.setattr(scheme_eligibility_checker_factory, "load_scheme_eligibility_checker", counting_load)
+    results = scheme_manager.check_scheme_eligibility_for_applicants(retrenchment_assistance_scheme, applicants)
+
+    assert [result.report for result in results] == expected
+    assert loads == [retrenchment_assistance_scheme.id]
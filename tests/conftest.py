@@ -29,7 +29,8 @@ Design Patterns:
 
 """
 import pytest
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 from environs import Env
@@ -145,6 +146,30 @@ def api_test_db__NonTransactional(api_test_db_connection):
     finally:
         session.close()  # Close the session to release the connection
 
+@pytest.fixture(scope="function")
+def query_counter():
+    """
+    Fixture to collect the SQL statements sent to a database within a block:
+
+        with query_counter(engine) as statements:
+            ...
+        assert len(statements) == 1
+    """
+    @contextmanager
+    def count_queries(engine):
+        statements = []
+
+        def record_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record_statement)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record_statement)
+
+    return count_queries
+
 @pytest.fixture(scope="function")
 def crud_operations(test_db):
     """
@@ -81,6 +81,29 @@ def test_create_applicant(crud_operations, test_administrator):
     assert applicant.created_by_admin_id == test_administrator.id   
 
 
+def test_create_applicant_with_household_members(crud_operations, test_administrator):
+    """
+    Test creating an applicant together with household members in one transaction, linked through the relationship.
+    """
+    applicant_data = {
+        "name": "Batch Doe",
+        "employment_status": "employed",
+        "sex": "F",
+        "date_of_birth": datetime(1982, 3, 3),
+        "marital_status": "married",
+        "created_by_admin_id": test_administrator.id
+    }
+    household_members_data = [
+        {"name": "Batch Child", "relation": "child", "date_of_birth": datetime(2012, 1, 1)},
+        {"name": "Batch Spouse", "relation": "spouse", "date_of_birth": datetime(1981, 5, 5)},
+        {"name": "Batch Parent", "relation": "parent", "date_of_birth": datetime(1950, 7, 7)},
+    ]
+    applicant = crud_operations.create_applicant(applicant_data, household_members_data)
+
+    assert sorted(member.name for member in applicant.household_members) == ["Batch Child", "Batch Parent", "Batch Spouse"]
+    assert all(member.applicant_id == applicant.id for member in applicant.household_members)
+    assert all('applicant_id' not in member_data for member_data in household_members_data)  # Caller's data is left untouched
+
 def test_get_applicant(crud_operations, test_applicant):
     """
     Test retrieving an applicant by ID and verify the details.
@@ -217,3 +240,102 @@ def test__neg_create_application_with_invalid_admin(crud_operations, test_applic
     with pytest.raises(IntegrityError):
         crud_operations.create_application(application_data)
 
+
+def test_applications_keyset_pagination(crud_operations, test_applicant, retrenchment_assistance_scheme):
+    """
+    Test that walking the applications with cursor pagination visits every application exactly once, in the same order as page-number pagination.
+    """
+    for _ in range(5):
+        crud_operations.create_application({
+            "applicant_id": test_applicant.id,
+            "scheme_id": retrenchment_assistance_scheme.id,
+            "status": "pending",
+            "created_by_admin_id": test_applicant.created_by_admin_id
+        })
+
+    for sort_order in ['asc', 'desc']:
+        all_applications, total_count = crud_operations.get_all_applications(page=1, page_size=1000, sort_order=sort_order)
+        assert total_count == len(all_applications) >= 5
+
+        walked_ids, cursor = [], None
+        while True:
+            page, cursor = crud_operations.get_applications_by_cursor(cursor=cursor, limit=2, sort_order=sort_order)
+            walked_ids.extend(application.id for application in page)
+            if cursor is None:
+                break
+        assert walked_ids == [application.id for application in all_applications]
+
+    # A page past the end still reports the total count
+    applications, past_end_count = crud_operations.get_all_applications(page=1000, page_size=10)
+    assert applications == [] and past_end_count == total_count
+
+def test_schemes_page_pagination_matches_cursor_order(crud_operations, retrenchment_assistance_scheme, senior_citizen_assistance_scheme):
+    """
+    Test that page-number pagination of the schemes is ID-ordered, so consecutive pages are disjoint and list the schemes in cursor order.
+    """
+    for index in range(5):
+        crud_operations.create_scheme({
+            "name": f"Paged Scheme {index}",
+            "description": "Scheme for pagination order",
+            "eligibility_criteria": {"employment_status": "unemployed"},
+            "benefits": {"amount": 100.0},
+            "validity_start_date": datetime(2023, 1, 1),
+            "validity_end_date": None
+        })
+
+    paged_ids, page = [], 1
+    while True:
+        schemes, total_count = crud_operations.get_schemes_by_filters({}, fetch_valid_schemes=False, page=page, per_page=2)
+        if not schemes:
+            break
+        paged_ids.extend(scheme.id for scheme in schemes)
+        page += 1
+
+    cursor_schemes, _ = crud_operations.get_schemes_by_cursor({}, fetch_valid_schemes=False, limit=1000)
+    assert len(paged_ids) == total_count
+    assert paged_ids == [scheme.id for scheme in cursor_schemes]
+
+
+def test_schemes_rows_match_serialized_schemes(crud_operations, retrenchment_assistance_scheme, senior_citizen_assistance_scheme):
+    """
+    Test that the Core scheme rows list the same page as the ORM query and encode to the same JSON as the SchemeSchema dump of the ORM objects.
+    """
+    from api.schemas.all_schemas import SchemeSchema
+    from api.schemas.fast_dump import compile_dumper
+    from api.utils.json import json_bytes
+
+    dump_scheme = compile_dumper(SchemeSchema)
+    for page in (1, 2):
+        schemes, total_count = crud_operations.get_schemes_by_filters({}, fetch_valid_schemes=False, page=page, per_page=1)
+        rows, rows_total_count = crud_operations.get_schemes_rows_by_filters({}, fetch_valid_schemes=False, page=page, per_page=1)
+        assert rows_total_count == total_count >= 2
+        assert json_bytes(rows) == json_bytes([dump_scheme(scheme) for scheme in schemes])
+
+    rows, rows_total_count = crud_operations.get_schemes_rows_by_filters({}, fetch_valid_schemes=False, page=1000, per_page=10)
+    assert rows == [] and rows_total_count == total_count
+
+
+def test_applications_listing_loads_each_scheme_once(crud_operations, test_applicant, retrenchment_assistance_scheme, query_counter):
+    """
+    Test that an applications page loads its applicants, their households and the schemes in a fixed number of queries,
+    without repeating the scheme columns on every application row.
+    """
+    for _ in range(3):
+        crud_operations.create_application({
+            "applicant_id": test_applicant.id,
+            "scheme_id": retrenchment_assistance_scheme.id,
+            "status": "pending",
+            "created_by_admin_id": test_applicant.created_by_admin_id
+        })
+    crud_operations.db_session.expunge_all()  # Start from an empty identity map, as a new request would
+
+    engine = crud_operations.db_session.get_bind()
+    with query_counter(engine) as statements:
+        applications, total_count = crud_operations.get_all_applications(page=1, page_size=10)
+        for application in applications:  # Everything the listing serializes must already be loaded
+            application.scheme.benefits
+            list(application.applicant.household_members)
+
+    assert len(applications) >= 3
+    assert len(statements) == 3  # Page query with windowed total count, applicants (with households) SELECT ... IN, schemes SELECT ... IN
+    assert 'Schemes' not in statements[0]  # Scheme columns are not joined onto the page rows
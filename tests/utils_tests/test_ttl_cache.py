@@ -0,0 +1,44 @@
+# Copyright (c) 2024 by Jonathan AW
+
+from utils import ttl_cache
+from utils.ttl_cache import TTLCache
+
+def test_get_returns_stored_value():
+    """
+    Test that a stored value is returned until it is removed.
+    """
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.pop("a") == 1
+    assert cache.get("a") is None
+    assert cache.get("a", "missing") == "missing"
+
+def test_entries_expire_after_ttl(monkeypatch):
+    """
+    Test that an entry is no longer returned once its time-to-live has passed.
+    """
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=2, ttl=30)
+    cache.set("a", 1)
+
+    now[0] += 29
+    assert cache.get("a") == 1
+    now[0] += 1
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+def test_least_recently_used_entry_is_evicted():
+    """
+    Test that storing beyond maxsize evicts the least recently used entry.
+    """
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
@@ -0,0 +1,79 @@
+# Copyright (c) 2024 by Jonathan AW
+"""
+Purpose: A small thread-safe, size-bounded, time-limited in-process cache.
+
+Entries expire ttl seconds after they are stored, and the least recently used entry is evicted once maxsize is reached.
+Cache keys should embed a version of the data they derive from, so that a change to the data selects a new key
+instead of relying on the TTL to drop a stale entry.
+
+"""
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    LRU cache whose entries expire after a fixed time-to-live.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize (int): The maximum number of entries kept.
+            ttl (float): The number of seconds an entry stays valid after it is stored.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.__entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.__lock = Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Retrieve a live entry and mark it as recently used.
+
+        Returns:
+            Any: The cached value, or default if the key is missing or its entry has expired.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self.__entries[key]
+                return default
+            self.__entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used one if the cache is full.
+        """
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + self.ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Remove an entry.
+
+        Returns:
+            Any: The removed value (even if expired), or default if the key is missing.
+        """
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)